@@ -7,6 +7,7 @@ CORS middleware ve tüm router'ları yapılandırır.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -26,6 +27,7 @@ from app.routers import decision, health, internal, reports, scores, species, sp
 from app.services.firebase import initialize_firebase
 from app.models.enums import SpeciesId
 from app.services.rules import load_and_validate_rules
+from app.services.solunar import solunar_refresh_loop
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -131,11 +133,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("Firebase init atlandı: %s", e)
 
+    # Solunar günlük ön-ısıtma: istek yolu cache'ten okur
+    solunar_task = asyncio.create_task(solunar_refresh_loop())
+    logger.info("Solunar ön-ısıtma görevi başlatıldı")
+
     logger.info("FishCast API hazır.")
 
     yield
 
     # --- Shutdown ---
+    solunar_task.cancel()
     logger.info("FishCast API kapatılıyor...")
 
 
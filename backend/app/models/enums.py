@@ -5,6 +5,16 @@ These are the SINGLE SOURCE OF TRUTH for enum values across the backend.
 """
 
 from enum import Enum
+from typing import Any
+
+
+def plain_value(v: Any) -> Any:
+    """Enum veya string'i düz string'e normalize eder.
+
+    Karar ve kural kodu hem enum hem düz string alan objelerle çalışır;
+    `getattr` default'lu tek lookup, hasattr-dispatch'ten daha hızlıdır.
+    """
+    return getattr(v, "value", v)
 
 
 class SpeciesId(str, Enum):
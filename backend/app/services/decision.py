@@ -8,19 +8,24 @@ Contract version: 1.3.
 from __future__ import annotations
 
 import logging
+import sys
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from itertools import count
 from typing import Any, Optional
 
+from app.models.enums import plain_value
 from app.models.spot import SpotOut
 from app.services.mode import derive_mode
 from app.services.rules import (
     TIER1_SPECIES,
     build_rule_context,
     evaluate_rules,
+    rules_used_fields,
 )
 from app.services.scoring import (
-    calculate_species_score,
+    calculate_all_species_scores,
     compute_water_mass_proxy,
 )
 from app.services.solunar import compute_daylight
@@ -60,6 +65,15 @@ MODE_AVOID_TECHNIQUES: dict[str, list[str]] = {
     "holding": ["spin", "shore_jig", "capari"],
 }
 
+# Intern sabit id key'leri: hot .get() path'lerinde interned string'ler
+# pointer-eşitlikle karşılaştırılır (tam PyUnicode karşılaştırması atlanır).
+SPECIES_NAME_TR = {sys.intern(k): v for k, v in SPECIES_NAME_TR.items()}
+TECHNIQUE_NAME_TR = {sys.intern(k): v for k, v in TECHNIQUE_NAME_TR.items()}
+MODE_AVOID_TECHNIQUES = {
+    sys.intern(k): [sys.intern(t) for t in v]
+    for k, v in MODE_AVOID_TECHNIQUES.items()
+}
+
 
 def compute_best_windows(
     solunar_data: dict[str, Any],
@@ -101,6 +115,97 @@ def compute_best_windows(
     return windows[:4]
 
 
+
+
+# --- Spot score memoization ---
+# Consecutive polls within a short window repeat identical per-spot work
+# (rule evaluation + 6 species scores). Bounded LRU keyed on quantized
+# weather + the other inputs, mirroring the weather-service cache pattern.
+_spot_score_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+_SPOT_SCORE_CACHE_MAX = 1024
+
+# Identity tokens for config/rules objects. Holding a reference pins the
+# object alive, so an id() can never be recycled while its entry exists.
+_obj_tokens: dict[int, tuple[Any, int]] = {}
+_obj_token_counter = count(1)
+
+
+def _obj_token(obj: Any) -> int:
+    """Stable token for a long-lived config/rules object (None → 0)."""
+    if obj is None:
+        return 0
+    entry = _obj_tokens.get(id(obj))
+    if entry is not None:
+        return entry[1]
+    token = next(_obj_token_counter)
+    _obj_tokens[id(obj)] = (obj, token)
+    return token
+
+
+def _spot_scores_cache_key(
+    spot: SpotOut,
+    weather: WeatherData,
+    solunar_data: dict[str, Any],
+    rules: list[dict[str, Any]],
+    now: datetime,
+    report_signals: Optional[dict[str, Any]],
+    scoring_config: Optional[dict[str, Any]],
+    seasonality_config: Optional[dict[str, Any]],
+    daylight_data: Optional[dict[str, Any]],
+    water_mass_proxy: Optional[dict[str, Any]],
+    trace_level: str,
+) -> Optional[tuple]:
+    """Build the memo key; None when inputs are not cache-safe."""
+    try:
+        sea = weather.sea_temp_c
+        wind_exp = getattr(spot, "wind_exposure", None)
+        key = (
+            # Spot (everything the scoring path reads)
+            spot.id,
+            plain_value(spot.shore),
+            plain_value(spot.accuracy),
+            plain_value(spot.region_id),
+            spot.pelagic_corridor,
+            tuple(spot.features),
+            tuple(getattr(spot, "sheltered_from", None) or ()),
+            tuple(wind_exp.onshore_dirs_deg) if wind_exp is not None else None,
+            wind_exp.shelter_score_0to1 if wind_exp is not None else None,
+            # Weather (quantized — same bucket scores identically)
+            round(weather.wind_speed_kmh),
+            weather.wind_dir_deg,
+            weather.wind_direction_cardinal,
+            round(weather.pressure_hpa * 10),
+            round(weather.pressure_change_3h_hpa * 10),
+            plain_value(weather.pressure_trend),
+            round(weather.air_temp_c),
+            round(sea * 10) if sea is not None else None,
+            round(weather.cloud_cover_pct),
+            plain_value(weather.data_quality),
+            # Solunar + daylight + water mass
+            tuple((p["start"], p["end"]) for p in solunar_data.get("majorPeriods", [])),
+            tuple((p["start"], p["end"]) for p in solunar_data.get("minorPeriods", [])),
+            solunar_data.get("moonIllumination", 50),
+            solunar_data.get("solunarRating", 0.5),
+            daylight_data.get("isDaylight") if daylight_data else None,
+            (water_mass_proxy.get("type"), water_mass_proxy.get("strength")) if water_mass_proxy else None,
+            # Time (minute resolution — scores depend on hour+minute)
+            (now.year, now.month, now.day, now.hour, now.minute),
+            # Report signals (only fields the scoring/mode path consults)
+            (
+                report_signals.get("totalReports", 0) > 0,
+                bool(report_signals.get("naturalBaitBias")),
+            ) if report_signals is not None else None,
+            trace_level,
+            _obj_token(rules),
+            _obj_token(scoring_config),
+            _obj_token(seasonality_config),
+        )
+        hash(key)
+    except (TypeError, AttributeError):
+        return None
+    return key
+
+
 def compute_spot_scores(
     spot: SpotOut,
     weather: WeatherData,
@@ -118,21 +223,64 @@ def compute_spot_scores(
 
     v1.3: Accepts scoring_config, seasonality_config, daylight_data, water_mass_proxy.
     v1.3.1: trace_level param for debugging.
+
+    Sonuç LRU-memoize edilir (aynı dakika + aynı hava bucket'ı → aynı dict).
+    Dönen dict paylaşılır; caller mutate etmemelidir.
     """
+    cache_key = _spot_scores_cache_key(
+        spot, weather, solunar_data, rules, now, report_signals,
+        scoring_config, seasonality_config, daylight_data, water_mass_proxy,
+        trace_level,
+    )
+    if cache_key is not None:
+        cached = _spot_score_cache.get(cache_key)
+        if cached is not None:
+            _spot_score_cache.move_to_end(cache_key)
+            return cached
+
+    result_dict = _compute_spot_scores_uncached(
+        spot, weather, solunar_data, rules, now, report_signals,
+        scoring_config, seasonality_config, daylight_data, water_mass_proxy,
+        trace_level,
+    )
+
+    if cache_key is not None:
+        _spot_score_cache[cache_key] = result_dict
+        while len(_spot_score_cache) > _SPOT_SCORE_CACHE_MAX:
+            _spot_score_cache.popitem(last=False)
+
+    return result_dict
+
+
+def _compute_spot_scores_uncached(
+    spot: SpotOut,
+    weather: WeatherData,
+    solunar_data: dict[str, Any],
+    rules: list[dict[str, Any]],
+    now: datetime,
+    report_signals: Optional[dict[str, Any]] = None,
+    scoring_config: Optional[dict[str, Any]] = None,
+    seasonality_config: Optional[dict[str, Any]] = None,
+    daylight_data: Optional[dict[str, Any]] = None,
+    water_mass_proxy: Optional[dict[str, Any]] = None,
+    trace_level: str = "none",
+) -> dict[str, Any]:
+    """compute_spot_scores'un cache'siz gövdesi."""
     # Build context with v1.3 fields
     context = build_rule_context(
         weather, spot, solunar_data, now,
         daylight_data=daylight_data,
         water_mass_proxy=water_mass_proxy,
+        used_fields=rules_used_fields(rules),
     )
     rule_result = evaluate_rules(
         rules, context, TIER1_SPECIES,
         scoring_config=scoring_config,
     )
 
-    shore_str = spot.shore.value if hasattr(spot.shore, 'value') else spot.shore
+    shore_str = plain_value(spot.shore)
     has_reports = report_signals is not None and report_signals.get("totalReports", 0) > 0
-    coord_accuracy = spot.accuracy.value if hasattr(spot.accuracy, 'value') else spot.accuracy
+    coord_accuracy = plain_value(spot.accuracy)
 
     # Pressure config for mode derivation
     pressure_config = None
@@ -140,28 +288,31 @@ def compute_spot_scores(
         pressure_config = scoring_config["pressureThresholds"]
 
     species_scores: dict[str, dict[str, Any]] = {}
+    open_species: list[tuple[str, dict[str, Any]]] = []
     score_sum = 0
     score_count = 0
 
+    # Türden bağımsız parametre skorları (basınç/rüzgar/solunar) tek geçişte
+    # hesaplanır; sonuçlar tür başına calculate_species_score ile birebir aynı.
+    score_data_by_species = calculate_all_species_scores(
+        species_ids=TIER1_SPECIES,
+        weather=weather,
+        solunar_data=solunar_data,
+        shore=shore_str,
+        rule_bonuses=rule_result.species_bonuses,
+        month=now.month,
+        hour=now.hour,
+        minute=now.minute,
+        data_quality=weather.data_quality,
+        has_reports_24h=has_reports,
+        scoring_config=scoring_config,
+        seasonality_config=seasonality_config,
+        coord_accuracy=coord_accuracy,
+        fired_rules_count=rule_result.fired_rules_count,
+    )
+
     for sp_id in TIER1_SPECIES:
-        bonus = rule_result.species_bonuses.get(sp_id, 0)
-
-        score_data = calculate_species_score(
-            species_id=sp_id,
-            weather=weather,
-            solunar_data=solunar_data,
-            shore=shore_str,
-            rule_bonus=bonus,
-            month=now.month,
-            hour=now.hour,
-            minute=now.minute,
-            data_quality=weather.data_quality,
-            has_reports_24h=has_reports,
-            scoring_config=scoring_config,
-            seasonality_config=seasonality_config,
-            coord_accuracy=coord_accuracy,
-            fired_rules_count=rule_result.fired_rules_count,
-        )
+        score_data = score_data_by_species[sp_id]
 
         # Mode derivation
         mode = derive_mode(
@@ -214,16 +365,19 @@ def compute_spot_scores(
         }
 
         if score_data["seasonStatus"] != "off":
+            open_species.append((sp_id, species_scores[sp_id]))
             score_sum += score_data["score"]
             score_count += 1
 
+    open_species.sort(key=lambda x: (-x[1]["score"], x[0]))
+
     overall_score = round(score_sum / max(1, score_count))
     if rule_result.is_no_go:
         overall_score = 0
 
     # Build trace based on trace_level
     trace: Optional[dict[str, Any]] = None
-    dq_val = weather.data_quality.value if hasattr(weather.data_quality, 'value') else weather.data_quality
+    dq_val = plain_value(weather.data_quality)
     if trace_level == "minimal":
         trace = {
             "firedRulesCount": rule_result.fired_rules_count,
@@ -245,6 +399,7 @@ def compute_spot_scores(
 
     result_dict: dict[str, Any] = {
         "speciesScores": species_scores,
+        "openSpeciesSorted": open_species,
         "overallScore": overall_score,
         "noGo": {
             "isNoGo": rule_result.is_no_go,
@@ -301,7 +456,7 @@ def _compute_health_block(weather: WeatherData) -> dict[str, Any]:
     reasons_code: list[str] = []
     reasons_tr: list[str] = list(weather.data_issues)
     status = "good"
-    dq = weather.data_quality.value if hasattr(weather.data_quality, 'value') else weather.data_quality
+    dq = plain_value(weather.data_quality)
 
     if dq == "fallback":
         status = "bad"
@@ -324,7 +479,7 @@ def _compute_health_block(weather: WeatherData) -> dict[str, Any]:
         reasons_tr.append("Dalga yüksekliği verisi yok")
 
     cardinal = weather.wind_direction_cardinal if hasattr(weather, 'wind_direction_cardinal') else "N"
-    trend = weather.pressure_trend.value if hasattr(weather.pressure_trend, 'value') else weather.pressure_trend
+    trend = plain_value(weather.pressure_trend)
 
     normalized = {
         "windSpeedKmhRaw": round(weather.wind_speed_kmh, 1),
@@ -394,9 +549,11 @@ def generate_decision(
     global_no_go = any(r["noGo"]["isNoGo"] for r in spot_results.values())
     global_no_go_reasons: list[str] = []
     if global_no_go:
+        seen_reasons: set[str] = set()
         for r in spot_results.values():
             for reason in r["noGo"]["reasonsTR"]:
-                if reason not in global_no_go_reasons:
+                if reason not in seen_reasons:
+                    seen_reasons.add(reason)
                     global_no_go_reasons.append(reason)
 
     # Sheltered exceptions (only computed when noGo is active)
@@ -410,8 +567,17 @@ def generate_decision(
     regions_output: list[dict[str, Any]] = []
     region_ids = ["avrupa", "anadolu", "city_belt"]
 
+    # Bölge döngüsünde değişmeyen hava türevleri (3× tekrar hesaplamamak için)
+    spot_wind_band_min = round(max(0, weather.wind_speed_kmh - 5))
+    spot_wind_band_max = round(weather.wind_speed_kmh + 10)
+    wind_is_light = weather.wind_speed_kmh <= 15
+    light_wind_msg = (
+        f"{weather.wind_direction_tr.capitalize()} hafif — uygun koşullar"
+        if wind_is_light else None
+    )
+
     for region_id in region_ids:
-        region_spots = [s for s in spots if (s.region_id.value if hasattr(s.region_id, 'value') else s.region_id) == region_id]
+        region_spots = [s for s in spots if plain_value(s.region_id) == region_id]
 
         if not region_spots:
             continue
@@ -422,70 +588,54 @@ def generate_decision(
         )
 
         result = spot_results[best_spot.id]
-        species_scores = result["speciesScores"]
-
-        sorted_species = sorted(
-            [
-                (sp_id, data)
-                for sp_id, data in species_scores.items()
-                if data["seasonStatus"] != "off"
-            ],
-            key=lambda x: (-x[1]["score"], x[0]),
-        )[:4]
-
-        targets: list[dict[str, Any]] = []
-        for sp_id, sp_data in sorted_species:
-            best_window_idx: Optional[int] = None
-            if best_windows:
-                best_window_idx = 0
-
-            targets.append({
+
+        # Pre-filtered and pre-sorted in compute_spot_scores (single pass)
+        sorted_species = result["openSpeciesSorted"][:4]
+
+        best_window_idx: Optional[int] = 0 if best_windows else None
+        targets = [
+            {
                 "speciesId": sp_id,
                 "speciesNameTR": SPECIES_NAME_TR.get(sp_id, sp_id),
                 "score0to100": sp_data["score"],
                 "confidence0to1": sp_data["confidence0to1"],
                 "mode": sp_data["mode"],
                 "bestWindowIndex": best_window_idx,
-            })
+            }
+            for sp_id, sp_data in sorted_species
+        ]
 
-        recommended_techniques: list[dict[str, Any]] = []
-        seen_techniques: set[str] = set()
+        # dict-as-ordered-set: ilk görülen teknik kazanır, insertion order korunur
+        recommended_by_id: dict[str, dict[str, Any]] = {}
         for _, sp_data in sorted_species:
             for tech in sp_data.get("recommendedTechniques", []):
-                tid = tech["techniqueId"]
-                if tid not in seen_techniques:
-                    seen_techniques.add(tid)
-                    recommended_techniques.append(tech)
+                recommended_by_id.setdefault(tech["techniqueId"], tech)
 
-        if not recommended_techniques:
+        if not recommended_by_id:
             for tech_id in (best_spot.technique_bias or best_spot.primary_techniques)[:3]:
-                tid = tech_id.value if hasattr(tech_id, 'value') else tech_id
-                if tid not in seen_techniques:
-                    seen_techniques.add(tid)
-                    recommended_techniques.append({
-                        "techniqueId": tid,
-                        "techniqueNameTR": TECHNIQUE_NAME_TR.get(tid, tid),
-                        "setupHintTR": None,
-                    })
-
-        avoid_techniques: list[dict[str, Any]] = []
-        seen_avoid: set[str] = set()
+                tid = plain_value(tech_id)
+                recommended_by_id.setdefault(tid, {
+                    "techniqueId": tid,
+                    "techniqueNameTR": TECHNIQUE_NAME_TR.get(tid, tid),
+                    "setupHintTR": None,
+                })
+        recommended_techniques = list(recommended_by_id.values())
+
+        avoid_by_id: dict[str, dict[str, Any]] = {}
         for _, sp_data in sorted_species:
             for tech in sp_data.get("avoidTechniques", []):
-                tid = tech["techniqueId"]
-                if tid not in seen_avoid:
-                    seen_avoid.add(tid)
-                    avoid_techniques.append(tech)
-
-        why_tr: list[str] = []
-        for rule_info in result["activeRules"][:2]:
-            if rule_info["messageTR"] and rule_info["messageTR"] not in why_tr:
-                why_tr.append(rule_info["messageTR"])
+                avoid_by_id.setdefault(tech["techniqueId"], tech)
+        avoid_techniques = list(avoid_by_id.values())
+
+        why_tr = list(dict.fromkeys(
+            rule_info["messageTR"]
+            for rule_info in result["activeRules"][:2]
+            if rule_info["messageTR"]
+        ))
         if best_spot.pelagic_corridor:
             why_tr.append("Pelajik koridorda — göçmen türler geçişte")
-        if weather.wind_speed_kmh <= 15:
-            tr_name = weather.wind_direction_tr
-            why_tr.append(f"{tr_name.capitalize()} hafif — uygun koşullar")
+        if light_wind_msg is not None:
+            why_tr.append(light_wind_msg)
         why_tr = why_tr[:3]
 
         spot_signals = report_signals_map.get(best_spot.id)
@@ -495,8 +645,8 @@ def generate_decision(
             "recommendedSpot": {
                 "spotId": best_spot.id,
                 "nameTR": best_spot.name,
-                "spotWindBandKmhMin": round(max(0, weather.wind_speed_kmh - 5)),
-                "spotWindBandKmhMax": round(weather.wind_speed_kmh + 10),
+                "spotWindBandKmhMin": spot_wind_band_min,
+                "spotWindBandKmhMax": spot_wind_band_max,
                 "whyTR": why_tr,
                 "targets": targets,
                 "recommendedTechniques": recommended_techniques[:3],
@@ -6,12 +6,19 @@ Firebase Admin SDK initialization, Firestore client, Auth token verification.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Token doğrulama için ayrılmış havuz: default executor'ı diğer to_thread
+# işleriyle paylaşmak yerine auth burst'lerini (mobil cold-start) kendi
+# worker'larında karşılar.
+_auth_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fb-auth")
+
 _firestore_client: Any = None
 _initialized = False
 
@@ -89,8 +96,11 @@ async def verify_firebase_token(token: str) -> Optional[dict[str, Any]]:
 
     try:
         from firebase_admin import auth
-        # D2: Run sync verify_id_token in thread pool to avoid blocking event loop
-        decoded = await asyncio.to_thread(auth.verify_id_token, token, check_revoked=True)
+        # D2: Run sync verify_id_token off the event loop, on the dedicated pool
+        decoded = await asyncio.get_running_loop().run_in_executor(
+            _auth_executor,
+            functools.partial(auth.verify_id_token, token, check_revoked=True),
+        )
         return decoded
     except Exception as e:
         # Categorize error for clear logging
@@ -9,6 +9,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Optional
 
+from app.models.enums import plain_value
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,7 +94,7 @@ def derive_mode(
 
     # P4: Good solunar + stable → chasing
     solunar_rating = solunar_data.get("solunarRating", 0.5)
-    pressure_trend = weather.pressure_trend.value if hasattr(weather.pressure_trend, 'value') else weather.pressure_trend
+    pressure_trend = plain_value(weather.pressure_trend)
 
     if solunar_rating >= 0.6 and pressure_trend == "stable":
         return "chasing"
@@ -15,25 +15,50 @@ from __future__ import annotations
 
 import json
 import logging
+import operator
+import os
+import pickle
+import sys
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
+from functools import lru_cache
+from itertools import count as _count
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 import jsonschema
 
+try:  # libyaml varsa C loader: büyük YAML'da birkaç kat hızlı parse
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - kuruluma bağlı
+    from yaml import SafeLoader as _YamlLoader
+
+try:  # fastjsonschema: şema-özel codegen'li validator (opsiyonel bağımlılık)
+    import fastjsonschema as _fastjsonschema
+except ImportError:  # pragma: no cover - kuruluma bağlı
+    _fastjsonschema = None
+
+from app.models.enums import plain_value
+
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 
 # Tier 1 species for wildcard expansion (v1.3: mirmir promoted)
-TIER1_SPECIES = [
+# Id'ler intern'li: kural değerlendirmesindeki membership/dict lookuplarda
+# karşılaştırma pointer-eşitlikle kısa devre yapar.
+TIER1_SPECIES = [sys.intern(s) for s in (
     "istavrit", "cinekop", "sarikanat", "palamut", "karagoz", "mirmir",
-]
-ALL_SPECIES = [
+)]
+ALL_SPECIES = [sys.intern(s) for s in (
     "istavrit", "cinekop", "sarikanat", "palamut", "karagoz",
     "lufer", "levrek", "kolyoz", "mirmir",
-]
+)]
+
+# Frozenset karşılıkları: O(1) membership (listeler sıra için korunur)
+TIER1_SPECIES_SET = frozenset(TIER1_SPECIES)
+ALL_SPECIES_SET = frozenset(ALL_SPECIES)
 
 # Category inference from priority (fallback when rule has no explicit category)
 _PRIORITY_TO_CATEGORY: dict[int, str] = {
@@ -52,44 +77,175 @@ def _infer_category(priority: int) -> str:
     return _PRIORITY_TO_CATEGORY.get(priority, "techniqueTime")
 
 
+@lru_cache(maxsize=4)
+def _compiled_validator(schema_text: str) -> jsonschema.Draft7Validator:
+    """Schema metninden derlenmiş validator (reload'larda yeniden kurulmaz).
+
+    jsonschema.validate her çağrıda schema'yı meta-validate edip yeniden
+    derler; burada check_schema + derleme schema metni başına bir kez yapılır.
+    """
+    schema = json.loads(schema_text)
+    jsonschema.Draft7Validator.check_schema(schema)
+    return jsonschema.Draft7Validator(schema)
+
+
+@lru_cache(maxsize=4)
+def _fast_validator(schema_text: str) -> Optional[Any]:
+    """fastjsonschema ile codegen'li validator; paket yoksa None."""
+    if _fastjsonschema is None:
+        return None
+    return _fastjsonschema.compile(json.loads(schema_text))
+
+
+def _validate_rules(rules: Any, schema_text: str) -> None:
+    """Rules'u schema'ya karşı doğrular; hata mesajı tek formatta yükselir.
+
+    fastjsonschema kuruluysa onun ürettiği fonksiyon (interpreted jsonschema'dan
+    kat kat hızlı) kullanılır; değilse derlenmiş Draft7Validator'a düşer.
+
+    Raises:
+        jsonschema.ValidationError: Validation hatası (her iki backend'de de).
+    """
+    fast = _fast_validator(schema_text)
+    if fast is not None:
+        try:
+            fast(rules)
+        except _fastjsonschema.JsonSchemaException as e:
+            raise jsonschema.ValidationError(e.message) from e
+        return
+    _compiled_validator(schema_text).validate(rules)
+
+
+# Süreç içi singleton: aynı process'te tekrarlanan load çağrıları
+# (birden çok request path'i) disk I/O bile yapmadan aynı listeyi alır.
+# Fingerprint tutulduğu için dosya değişirse yeniden yüklenir.
+_rules_singleton: Optional[tuple[tuple, list[dict[str, Any]]]] = None
+
+
+def invalidate_rules_cache() -> None:
+    """Süreç içi rules singleton'ını düşürür (testler / hot-reload için)."""
+    global _rules_singleton
+    _rules_singleton = None
+
+
+# Warm-restart cache: doğrulanmış kural listesi pickle'lanır; kaynak
+# dosyalar değişmediyse (mtime_ns+size) YAML parse + schema validation atlanır.
+_RULES_CACHE_PATH = DATA_DIR / ".rules.cache.pkl"
+
+
+def _intern_tree(obj: Any) -> Any:
+    """Ağaçtaki tüm string'leri (key + value) intern'ler.
+
+    YAML/pickle her yüklemede taze string üretir; intern sonrası tekrar eden
+    atomlar (field adları, tür/teknik id'leri) pointer-eşitlikle karşılaştırılır.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, list):
+        return [_intern_tree(v) for v in obj]
+    if isinstance(obj, dict):
+        return {
+            sys.intern(k) if isinstance(k, str) else k: _intern_tree(v)
+            for k, v in obj.items()
+        }
+    return obj
+
+
+def _rules_cache_key(rules_path: Path, schema_path: Path) -> Optional[tuple]:
+    """Kaynak dosyaların fingerprint'i; stat edilemezse None (cache devre dışı)."""
+    try:
+        rs, ss = rules_path.stat(), schema_path.stat()
+    except OSError:
+        return None
+    return (rs.st_mtime_ns, rs.st_size, ss.st_mtime_ns, ss.st_size)
+
+
+def _load_rules_from_cache(cache_key: tuple) -> Optional[list[dict[str, Any]]]:
+    """Fingerprint eşleşirse cache'lenmiş kuralları döner; aksi halde None."""
+    try:
+        with open(_RULES_CACHE_PATH, "rb") as f:
+            payload = pickle.load(f)
+        if payload.get("key") == cache_key:
+            return payload["rules"]
+    except (OSError, pickle.PickleError, EOFError, KeyError, AttributeError):
+        pass
+    return None
+
+
+def _store_rules_cache(cache_key: tuple, rules: list[dict[str, Any]]) -> None:
+    """Kuralları atomik yazar (tmp + replace); hata sessizce yutulur."""
+    try:
+        tmp_path = _RULES_CACHE_PATH.with_suffix(".pkl.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": cache_key, "rules": rules}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _RULES_CACHE_PATH)
+    except OSError as e:
+        logger.debug("rules cache yazılamadı: %s", e)
+
+
 def load_and_validate_rules() -> list[dict[str, Any]]:
     """rules.yaml'ı yükler ve JSON Schema ile validate eder.
 
+    Warm restart'ta, kaynaklar değişmemişse doğrulanmış liste pickle
+    cache'ten gelir (YAML + validation atlanır); closure'lar her durumda
+    compile_rules ile yeniden kurulur.
+
     Returns:
         Validated rules listesi.
 
     Raises:
         SystemExit: Validation hatası → app crash.
     """
+    global _rules_singleton
+
     rules_path = DATA_DIR / "rules.yaml"
     schema_path = DATA_DIR / "rules_schema.json"
 
+    cache_key = _rules_cache_key(rules_path, schema_path)
+    if cache_key is not None:
+        if _rules_singleton is not None and _rules_singleton[0] == cache_key:
+            return _rules_singleton[1]
+        cached = _load_rules_from_cache(cache_key)
+        if cached is not None:
+            cached = _intern_tree(cached)
+            compile_rules(cached)
+            _rules_singleton = (cache_key, cached)
+            logger.info("rules.yaml cache'ten yüklendi: %d kural", len(cached))
+            return cached
+
     try:
         with open(rules_path, encoding="utf-8") as f:
-            rules = yaml.safe_load(f)
+            rules = _intern_tree(yaml.load(f, Loader=_YamlLoader))
     except Exception as e:
         logger.critical("rules.yaml yüklenemedi: %s", e)
         raise SystemExit(f"FATAL: rules.yaml yüklenemedi: {e}") from e
 
     try:
         with open(schema_path, encoding="utf-8") as f:
-            schema = json.load(f)
+            schema_text = f.read()
     except Exception as e:
         logger.critical("rules_schema.json yüklenemedi: %s", e)
         raise SystemExit(f"FATAL: rules_schema.json yüklenemedi: {e}") from e
 
     try:
-        jsonschema.validate(instance=rules, schema=schema)
+        _validate_rules(rules, schema_text)
     except jsonschema.ValidationError as e:
         logger.critical("rules.yaml validation hatası: %s", e.message)
         raise SystemExit(f"FATAL: rules.yaml geçersiz — {e.message}") from e
 
-    # Unique ID check
-    ids = [r["id"] for r in rules]
-    if len(ids) != len(set(ids)):
-        dupes = [x for x in ids if ids.count(x) > 1]
-        raise SystemExit(f"FATAL: rules.yaml'da tekrarlanan ID: {set(dupes)}")
+    # Unique ID check (tek geçiş)
+    id_counts = Counter(r["id"] for r in rules)
+    dupes = {rule_id for rule_id, n in id_counts.items() if n > 1}
+    if dupes:
+        raise SystemExit(f"FATAL: rules.yaml'da tekrarlanan ID: {dupes}")
 
+    if cache_key is not None:
+        _store_rules_cache(cache_key, rules)
+
+    compile_rules(rules)
+    if cache_key is not None:
+        _rules_singleton = (cache_key, rules)
     logger.info("rules.yaml validated: %d kural yüklendi", len(rules))
     return rules
 
@@ -199,6 +355,19 @@ def evaluate_condition(
                 return False
             continue
 
+        # Typed operator dict ({"gte": 12, "lt": 35})
+        if isinstance(expected, dict) and expected and all(k in _TYPED_OPS for k in expected):
+            if actual is None:
+                return False
+            try:
+                val = float(actual)
+                ok = all(_TYPED_OPS[k](val, float(v)) for k, v in expected.items())
+            except (ValueError, TypeError):
+                return False
+            if not ok:
+                return False
+            continue
+
         # Comparison operators (string starting with >=, <, etc.)
         if isinstance(expected, str) and expected and expected[0] in ">=<":
             if not _eval_comparison(actual, expected):
@@ -218,6 +387,321 @@ def evaluate_condition(
     return True
 
 
+# --- Condition Compilation ---
+#
+# evaluate_condition her çağrıda condition dict'ini yeniden yorumlar
+# (prefix sniffing, endswith, split...). Derleme adımı her field'ı BİR kez
+# parse edip context alan closure'lara çevirir; evaluate_rules sıcak yolda
+# sadece closure listesini gezer. Kural dict'ine "_compiled" olarak ilk
+# kullanımda tembelce iliştirilir (testler ham dict listesi geçirir).
+
+# Karşılaştırma önekleri uzun önce: ">=" / "<=", sonra ">" / "<"
+_CMP_OPS = (
+    (">=", operator.ge),
+    ("<=", operator.le),
+    (">", operator.gt),
+    ("<", operator.lt),
+)
+
+
+def _parse_time_range(time_range: str):
+    """"HH:MM-HH:MM" ifadesini (start_min, end_min, wraps) üçlüsüne parse eder.
+
+    Geçersiz formatta None döner; wraps, gece yarısını saran aralığı işaretler.
+    """
+    try:
+        parts = time_range.split("-")
+        sh, sm = parts[0].strip().split(":")
+        eh, em = parts[1].strip().split(":")
+        start_min = int(sh) * 60 + int(sm)
+        end_min = int(eh) * 60 + int(em)
+    except (ValueError, IndexError, AttributeError):
+        return None
+    return start_min, end_min, start_min > end_min
+
+
+# Typed operator form: {"gte": 12, "lt": 35} — string önek sniffing'e alternatif
+_TYPED_OPS = {
+    "gte": operator.ge,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "eq": operator.eq,
+}
+
+
+def _parse_cmp(condition_val: str):
+    """">=12" gibi bir ifadeyi (op, eşik) çiftine parse eder; geçersizse None."""
+    for prefix, op in _CMP_OPS:
+        if condition_val.startswith(prefix):
+            try:
+                return op, float(condition_val[len(prefix):])
+            except (ValueError, TypeError):
+                return None
+    return None
+
+
+def _compile_field(field: str, expected: Any):
+    """Tek bir condition field'ını predicate closure'a derler.
+
+    None dönerse field her zaman geçer (species_in_context gibi).
+    Semantik, evaluate_condition ile birebir aynıdır.
+    """
+    # time: "HH:MM-HH:MM" — 1440-dakikalık bitmap'e derlenir; runtime tek
+    # indeksli load, gece yarısı wrap dahil dalsız
+    if field == "time":
+        parsed = _parse_time_range(expected)
+        if parsed is None:
+            return lambda ctx: False
+        start_min, end_min, wraps = parsed
+        mask = bytearray(1440)
+        if not wraps:
+            for i in range(start_min, min(end_min, 1439) + 1):
+                mask[i] = 1
+        else:
+            for i in range(start_min, 1440):
+                mask[i] = 1
+            for i in range(0, min(end_min, 1439) + 1):
+                mask[i] = 1
+        time_mask = bytes(mask)
+        return lambda ctx: (
+            time_mask[(ctx.get("hour", 0) * 60 + ctx.get("minute", 0)) % 1440] != 0
+        )
+
+    if field == "month":
+        if isinstance(expected, list):
+            months = frozenset(expected)
+            return lambda ctx: ctx.get("month", 0) in months
+        return lambda ctx: ctx.get("month", 0) == expected
+
+    if field.endswith("_range"):
+        base_field = field.replace("_range", "")
+        if not isinstance(expected, list) or len(expected) != 2:
+            return lambda ctx: False
+        try:
+            lo, hi = float(expected[0]), float(expected[1])
+        except (ValueError, TypeError):
+            return lambda ctx: False
+
+        def _range(ctx: dict[str, Any]) -> bool:
+            actual = ctx.get(base_field)
+            if actual is None:
+                return False
+            try:
+                return lo <= float(actual) <= hi
+            except (ValueError, TypeError):
+                return False
+        return _range
+
+    if field == "features_include":
+        return lambda ctx: expected in ctx.get("features", [])
+
+    # species_in_context: her zaman true (effects'te tür bazında uygulanır)
+    if field == "species_in_context":
+        return None
+
+    if field in ("pelagicCorridor", "after_rain", "isDaylight"):
+        flag = bool(expected)
+
+        def _bool(ctx: dict[str, Any]) -> bool:
+            actual = ctx.get(field)
+            return actual is not None and bool(actual) == flag
+        return _bool
+
+    if isinstance(expected, dict) and expected and all(k in _TYPED_OPS for k in expected):
+        try:
+            pairs = tuple((_TYPED_OPS[k], float(v)) for k, v in expected.items())
+        except (ValueError, TypeError):
+            # Şema condition objesini serbest bıraktığı için buraya ancak
+            # bozuk bir eşik düşer — sessizce False'a derlemek yerine uyar
+            logger.warning(
+                "Typed operatör condition derlenemedi (sayısal eşik bekleniyordu): %s=%r",
+                field, expected,
+            )
+            return lambda ctx: False
+
+        def _typed_cmp(ctx: dict[str, Any]) -> bool:
+            actual = ctx.get(field)
+            if actual is None:
+                return False
+            try:
+                val = float(actual)
+            except (ValueError, TypeError):
+                return False
+            for op, threshold in pairs:
+                if not op(val, threshold):
+                    return False
+            return True
+        return _typed_cmp
+
+    if isinstance(expected, dict) and any(k in _TYPED_OPS for k in expected):
+        # Karışık anahtarlar (ör. {"gte": 12, "ltx": 35}) typed sayılmaz ve
+        # birebir-eşitlik matcher'ına düşer; neredeyse kesin yazım hatasıdır
+        logger.warning(
+            "Condition objesinde bilinmeyen operatör anahtarı: %s=%r (geçerli: %s)",
+            field, expected, sorted(_TYPED_OPS),
+        )
+
+    if isinstance(expected, str) and expected and expected[0] in ">=<":
+        parsed = _parse_cmp(expected)
+        if parsed is None:
+            return lambda ctx: False
+        op, threshold = parsed
+
+        def _cmp(ctx: dict[str, Any]) -> bool:
+            actual = ctx.get(field)
+            if actual is None:
+                return False
+            try:
+                return op(float(actual), threshold)
+            except (ValueError, TypeError):
+                return False
+        return _cmp
+
+    if isinstance(expected, list):
+        try:
+            values: Any = frozenset(expected)
+        except TypeError:  # unhashable eleman — listede kal
+            values = list(expected)
+
+        def _member(ctx: dict[str, Any]) -> bool:
+            try:
+                return ctx.get(field) in values
+            except TypeError:
+                # Bağlam değeri unhashable (ör. liste) — yorumlanan yol da
+                # eşleşme saymaz, 500 yerine False döneriz
+                return False
+        return _member
+
+    return lambda ctx: ctx.get(field) == expected
+
+
+def _field_cost(field: str, expected: Any) -> int:
+    """Statik maliyet modeli: ucuz/seçici alanlar önce denensin diye."""
+    if field in ("month", "regionId", "shore", "spot"):
+        return 1
+    if field in ("pelagicCorridor", "after_rain", "isDaylight"):
+        return 2
+    if isinstance(expected, str) and expected and expected[0] in ">=<":
+        return 3
+    if isinstance(expected, dict):
+        return 3
+    if field.endswith("_range"):
+        return 4
+    if field == "features_include":
+        return 5
+    if field == "time":
+        return 6
+    return 2  # düz eşitlik / liste-OR
+
+
+def _compile_condition(condition: dict[str, Any]) -> list:
+    """Condition dict'ini predicate closure listesine derler (AND zinciri).
+
+    Matcher'lar statik maliyete göre artan sıralanır: çoğu kural ilk ucuz
+    probeda reddedilir, pahalı kontroller (time, features) en sona kalır.
+    AND zincirinde sıra semantiği değiştirmez.
+    """
+    costed = []
+    for field, expected in condition.items():
+        m = _compile_field(field, expected)
+        if m is not None:
+            costed.append((_field_cost(field, expected), m))
+    costed.sort(key=lambda cm: cm[0])
+    return [m for _, m in costed]
+
+
+def compile_rules(rules: list[dict[str, Any]]) -> None:
+    """Kural listesini in-place derler (idempotent).
+
+    Condition closure'larının yanında sık okunan skaler alanlar da bir kez
+    çözülür ve underscore anahtarlarla kuralın üzerine yazılır; sıcak döngü
+    default'lu .get zincirleri yerine tek dict lookup yapar. "enabled"
+    bilerek dinamik kalır (çalışma anında aç/kapa edilebilir).
+    """
+    for rule in rules:
+        if "_compiled" in rule:
+            continue
+        priority = rule.get("priority", 1)
+        condition = rule.get("condition", {})
+        rule["_priority"] = priority
+        rule["_category"] = rule.get("category") or _infer_category(priority)
+        rule["_message_tr"] = rule.get("messageTR", "")
+        rule["_effects"] = rule.get("effects", [])
+        rule["_is_water_mass"] = "waterMassProxy" in condition
+        for effect in rule["_effects"]:
+            apply_to = effect.get("applyToSpecies", ["*"])
+            effect["_wildcard"] = "*" in apply_to
+            # ALL_SPECIES dışındaki id'ler elenmiş, sıra korunmuş hedef listesi
+            effect["_targets"] = [sp for sp in apply_to if sp in ALL_SPECIES_SET]
+        rule["_compiled"] = _compile_condition(condition)
+    rules.sort(key=operator.itemgetter("_priority"), reverse=True)
+
+
+# Kural setlerinin condition'larında geçen context alanları (token → set)
+_used_fields_cache: dict[int, frozenset[str]] = {}
+
+
+def rules_used_fields(rules: list[dict[str, Any]]) -> frozenset[str]:
+    """Kural setinin referans verdiği context alanlarının birleşimi.
+
+    build_rule_context'e verilirse yalnızca bu alanlar kurulur; sonuç
+    ruleset kimliği başına cache'lenir.
+    """
+    token = _ruleset_token(rules)
+    cached = _used_fields_cache.get(token)
+    if cached is not None:
+        return cached
+    used: set[str] = set()
+    for rule in rules:
+        for field in rule.get("condition", {}):
+            if field == "time":
+                used.update(("hour", "minute"))
+            elif field.endswith("_range"):
+                used.add(field.replace("_range", ""))
+            elif field == "features_include":
+                used.add("features")
+            elif field == "species_in_context":
+                continue
+            else:
+                used.add(field)
+    if "waterMassProxy" in used:
+        used.add("waterMassStrength")  # graded scaling bunu okur
+    fs = frozenset(used)
+    _used_fields_cache[token] = fs
+    return fs
+
+
+# Alan → getter tablosu; pruned context kurulumunda yalnızca istenen
+# alanların attribute'ları deref edilir. Değerler full build ile birebir.
+_CTX_BUILDERS: dict[str, Any] = {
+    "windSpeedKmh": lambda w, s, sd, now: w.wind_speed_kmh,
+    "windDirDeg": lambda w, s, sd, now: w.wind_dir_deg,
+    "windDirectionCardinal": lambda w, s, sd, now: w.wind_direction_cardinal,
+    "pressureHpa": lambda w, s, sd, now: w.pressure_hpa,
+    "pressureChange3hHpa": lambda w, s, sd, now: w.pressure_change_3h_hpa,
+    "pressureTrend": lambda w, s, sd, now: plain_value(w.pressure_trend),
+    "airTempC": lambda w, s, sd, now: w.air_temp_c,
+    "seaTempC": lambda w, s, sd, now: w.sea_temp_c,
+    "cloudCoverPct": lambda w, s, sd, now: w.cloud_cover_pct,
+    "shore": lambda w, s, sd, now: plain_value(s.shore),
+    "regionId": lambda w, s, sd, now: plain_value(s.region_id),
+    "spot": lambda w, s, sd, now: s.id,
+    "pelagicCorridor": lambda w, s, sd, now: s.pelagic_corridor,
+    "features": lambda w, s, sd, now: s.features,
+    "hour": lambda w, s, sd, now: now.hour,
+    "minute": lambda w, s, sd, now: now.minute,
+    "month": lambda w, s, sd, now: now.month,
+    "moonIllumination": lambda w, s, sd, now: sd.get("moonIllumination", 50),
+    "solunarRating": lambda w, s, sd, now: sd.get("solunarRating", 0.5),
+    "wind_history_48h": lambda w, s, sd, now: None,
+    "after_rain": lambda w, s, sd, now: False,
+    "hours_since_rain": lambda w, s, sd, now: None,
+    "moon_illumination": lambda w, s, sd, now: str(sd.get("moonIllumination", 50)),
+    "current_speed": lambda w, s, sd, now: None,
+}
+
+
 def build_rule_context(
     weather: Any,
     spot: Any,
@@ -225,26 +709,50 @@ def build_rule_context(
     now: Optional[datetime] = None,
     daylight_data: Optional[dict[str, Any]] = None,
     water_mass_proxy: Optional[dict[str, Any]] = None,
+    used_fields: Optional[frozenset[str]] = None,
 ) -> dict[str, Any]:
     """Rule evaluation için context dict oluşturur.
 
     v1.3: isDaylight, waterMassProxy, shelteredFrom added.
+
+    used_fields verilirse (bkz. rules_used_fields) yalnızca kuralların
+    okuduğu alanlar kurulur; default tam context'tir.
     """
     if now is None:
         now = datetime.now()
 
+    if used_fields is not None:
+        ctx = {
+            f: builder(weather, spot, solunar_data, now)
+            for f, builder in _CTX_BUILDERS.items() if f in used_fields
+        }
+        if "isDaylight" in used_fields:
+            ctx["isDaylight"] = (
+                daylight_data.get("isDaylight", True) if daylight_data else True
+            )
+        if "waterMassProxy" in used_fields or "waterMassStrength" in used_fields:
+            if water_mass_proxy:
+                ctx["waterMassProxy"] = water_mass_proxy.get("type", "neutral")
+                ctx["waterMassStrength"] = water_mass_proxy.get("strength", 0.0)
+            else:
+                ctx["waterMassProxy"] = "neutral"
+                ctx["waterMassStrength"] = 0.0
+        if "shelteredFrom" in used_fields:
+            ctx["shelteredFrom"] = getattr(spot, "sheltered_from", None) or []
+        return ctx
+
     ctx = {
         "windSpeedKmh": weather.wind_speed_kmh,
         "windDirDeg": weather.wind_dir_deg,
         "windDirectionCardinal": weather.wind_direction_cardinal,
         "pressureHpa": weather.pressure_hpa,
         "pressureChange3hHpa": weather.pressure_change_3h_hpa,
-        "pressureTrend": weather.pressure_trend.value if hasattr(weather.pressure_trend, 'value') else weather.pressure_trend,
+        "pressureTrend": plain_value(weather.pressure_trend),
         "airTempC": weather.air_temp_c,
         "seaTempC": weather.sea_temp_c,
         "cloudCoverPct": weather.cloud_cover_pct,
-        "shore": spot.shore.value if hasattr(spot.shore, 'value') else spot.shore,
-        "regionId": spot.region_id.value if hasattr(spot.region_id, 'value') else spot.region_id,
+        "shore": plain_value(spot.shore),
+        "regionId": plain_value(spot.region_id),
         "spot": spot.id,
         "pelagicCorridor": spot.pelagic_corridor,
         "features": spot.features,
@@ -285,6 +793,14 @@ def build_rule_context(
 class RuleResult:
     """Tek bir spot için tüm kuralların evaluation sonucu."""
 
+    __slots__ = (
+        "is_no_go", "no_go_reasons_tr", "species_bonuses", "technique_hints",
+        "remove_techniques", "mode_hints", "messages_tr", "active_rules",
+        "fired_rules_count", "category_raw_bonuses", "category_capped_bonuses",
+        "positive_total_raw", "positive_total_capped", "negative_total",
+        "final_rule_bonus",
+    )
+
     def __init__(self) -> None:
         self.is_no_go: bool = False
         self.no_go_reasons_tr: list[str] = []
@@ -305,6 +821,136 @@ class RuleResult:
         self.final_rule_bonus: dict[str, int] = {}       # final = capped_pos + neg
 
 
+# Ayrıştırıcı alanlara göre ters indeks: bir context için sadece aday
+# kurallar evaluate edilir (ör. regionId=avrupa iken istanbul kuralları
+# hiç denenmez). Eşitlik/liste koşulları indekslenir; diğer her şey
+# muhafazakâr biçimde "rest"e düşer, yani yanlış eleme mümkün değildir.
+_DISC_FIELDS = ("regionId", "shore", "spot", "month")
+
+_rule_indexes: dict[int, list[tuple[str, dict, frozenset]]] = {}
+
+
+def _build_rule_index(
+    rules: list[dict[str, Any]],
+) -> list[tuple[str, dict, frozenset]]:
+    """Kural listesi için (field, value→indices, rest_indices) indeksi kurar."""
+    index: list[tuple[str, dict, frozenset]] = []
+    for field in _DISC_FIELDS:
+        by_value: dict[Any, set[int]] = {}
+        rest: set[int] = set()
+        for i, rule in enumerate(rules):
+            expected = rule.get("condition", {}).get(field)
+            values: Optional[list[Any]] = None
+            if isinstance(expected, (str, int)) and not (
+                isinstance(expected, str) and expected and expected[0] in ">=<"
+            ):
+                values = [expected]
+            elif isinstance(expected, list) and all(
+                isinstance(v, (str, int)) for v in expected
+            ):
+                values = expected
+            if values is None:
+                rest.add(i)
+            else:
+                for v in values:
+                    by_value.setdefault(v, set()).add(i)
+        if by_value:
+            index.append((field, by_value, frozenset(rest)))
+    return index
+
+
+def _candidate_indices(
+    index: list[tuple[str, dict, frozenset]],
+    context: dict[str, Any],
+) -> Optional[set[int]]:
+    """İndeksten aday kural indeksleri; None → tüm kurallar aday."""
+    candidates: Optional[set[int]] = None
+    for field, by_value, rest in index:
+        ctx_val = context.get(field, 0) if field == "month" else context.get(field)
+        try:
+            matched = by_value.get(ctx_val)
+        except TypeError:  # unhashable context değeri — bu alanda eleme yapma
+            continue
+        allowed = rest if matched is None else (rest | matched)
+        candidates = allowed if candidates is None else (candidates & allowed)
+    return candidates
+
+
+# Varsayılan kategori cap'leri (scoring_config yoksa / ruleBonusCaps eksikse)
+_DEFAULT_CAPS = {"windCoastRules": 12, "istanbulSpecial": 10,
+                 "techniqueTime": 8, "weatherMode": 15, "totalCap": 25}
+_DEFAULT_CAP_MAP = {"windCoast": 12, "istanbul": 10, "techniqueTime": 8,
+                    "weatherMode": 15, "absolute": 999}
+
+# Config kimliği → (ref, (cat_cap_map, total_cap)); ref id() geri dönüşümünü önler
+_cap_maps: dict[int, tuple[Any, tuple[dict[str, int], int]]] = {}
+
+
+def _resolve_caps(scoring_config: Optional[dict[str, Any]]) -> tuple[dict[str, int], int]:
+    """scoring_config'ten kategori cap haritası + totalCap (config başına bir kez)."""
+    if not scoring_config or "ruleBonusCaps" not in scoring_config:
+        return _DEFAULT_CAP_MAP, _DEFAULT_CAPS["totalCap"]
+    entry = _cap_maps.get(id(scoring_config))
+    if entry is not None:
+        return entry[1]
+    caps = scoring_config["ruleBonusCaps"]
+    cat_cap_map = {
+        "windCoast": caps.get("windCoastRules", 12),
+        "istanbul": caps.get("istanbulSpecial", 10),
+        "techniqueTime": caps.get("techniqueTime", 8),
+        "weatherMode": caps.get("weatherMode", 15),
+        "absolute": 999,  # no cap on absolute rules
+    }
+    resolved = (cat_cap_map, caps.get("totalCap", 25))
+    _cap_maps[id(scoring_config)] = (scoring_config, resolved)
+    return resolved
+
+
+# Deterministik evaluate_rules sonuçları için bounded LRU (weather cache deseni).
+# Komşu spotlar aynı saat/hava bucket'ını paylaştığında aynı RuleResult döner;
+# tüketiciler sonucu yalnızca okur, o yüzden paylaşmak güvenlidir.
+_rule_result_cache: OrderedDict[tuple, RuleResult] = OrderedDict()
+_RULE_RESULT_CACHE_MAX = 512
+
+# Kural listesi kimlik token'ları: referans tutmak id() geri dönüşümünü engeller
+_ruleset_tokens: dict[int, tuple[list, int]] = {}
+_ruleset_token_counter = _count(1)
+
+
+def _ruleset_token(rules: list[dict[str, Any]]) -> int:
+    """Uzun ömürlü bir kural listesi için kimlik token'ı."""
+    entry = _ruleset_tokens.get(id(rules))
+    if entry is not None:
+        return entry[1]
+    token = next(_ruleset_token_counter)
+    _ruleset_tokens[id(rules)] = (rules, token)
+    return token
+
+
+def _evaluate_rules_cache_key(
+    rules: list[dict[str, Any]],
+    context: dict[str, Any],
+    species_list: list[str],
+    scoring_config: Optional[dict[str, Any]],
+) -> Optional[tuple]:
+    """Memo anahtarı; context hashable değilse None (cache atlanır)."""
+    try:
+        ctx_key = tuple(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in context.items()
+        )
+        caps = scoring_config.get("ruleBonusCaps") if scoring_config else None
+        caps_key = tuple(sorted(caps.items())) if caps else None
+        # enabled dinamik kalır; runtime toggle'lar anahtara yansısın
+        enabled_key = tuple(r.get("enabled", True) for r in rules)
+        key = (_ruleset_token(rules), enabled_key, ctx_key,
+               tuple(species_list), caps_key)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def evaluate_rules(
     rules: list[dict[str, Any]],
     context: dict[str, Any],
@@ -314,44 +960,80 @@ def evaluate_rules(
     """Tüm kuralları evaluate eder ve category-based caps ile conflict resolution uygular.
 
     v1.3: Per-category caps from scoring_config["ruleBonusCaps"].
+
+    Sonuç, birebir aynı girdiler için LRU-memoize edilir ve paylaşılan
+    (read-only kabul edilen) RuleResult döner.
     """
     if species_list is None:
         species_list = TIER1_SPECIES
+    species_set = TIER1_SPECIES_SET if species_list is TIER1_SPECIES else frozenset(species_list)
+
+    cache_key = _evaluate_rules_cache_key(rules, context, species_list, scoring_config)
+    if cache_key is not None:
+        cached = _rule_result_cache.get(cache_key)
+        if cached is not None:
+            _rule_result_cache.move_to_end(cache_key)
+            return cached
 
     result = RuleResult()
+    no_go_seen: set[str] = set()
 
     # Track bonuses per species per category for capping
     # species → category → sum of raw bonuses
-    cat_bonuses: dict[str, dict[str, int]] = {}
+    cat_bonuses: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    species_totals: defaultdict[str, int] = defaultdict(int)
+
+    # Teknik hint/remove birikimi: dict-as-ordered-set (O(1) membership,
+    # ekleme sırası korunur); sonda listeye materialize edilir.
+    hint_sets: dict[str, dict[str, None]] = {}
+    remove_sets: dict[str, dict[str, None]] = {}
+
+    if any("_compiled" not in r for r in rules):
+        compile_rules(rules)
 
-    sorted_rules = sorted(rules, key=lambda r: r.get("priority", 1), reverse=True)
+    token = _ruleset_token(rules)
+    index = _rule_indexes.get(token)
+    if index is None:
+        index = _rule_indexes[token] = _build_rule_index(rules)
 
-    for rule in sorted_rules:
+    # compile_rules listeyi priority-desc bıraktı; indeksler artan gezilirse
+    # öncelik sırası korunur, per-call sorted() gerekmez.
+    candidates = _candidate_indices(index, context)
+    pool = rules if candidates is None else [rules[i] for i in sorted(candidates)]
+
+    for rule in pool:
         # B1: Skip disabled rules (default: enabled=True)
         if not rule.get("enabled", True):
             continue
 
-        condition = rule.get("condition", {})
-        effects = rule.get("effects", [])
-        priority = rule.get("priority", 1)
-        message_tr = rule.get("messageTR", "")
-        category = rule.get("category") or _infer_category(priority)
-
-        if not evaluate_condition(condition, context):
+        effects = rule["_effects"]
+        priority = rule["_priority"]
+        message_tr = rule["_message_tr"]
+        category = rule["_category"]
+
+        # all(genexpr) yerine düz döngü: generator frame kurulumunu atlar
+        matched = True
+        for m in rule["_compiled"]:
+            if not m(context):
+                matched = False
+                break
+        if not matched:
             continue
 
         result.fired_rules_count += 1
-        rule_affected_species: list[str] = []
+        # dict-as-ordered-set: tekrarları eler, ekleme sırası deterministik
+        rule_affected_species: dict[str, None] = {}
 
         # B3: Apply waterMassStrength graded scaling for water mass rules
         # If a rule has waterMassProxy condition and waterMassStrength is in context,
         # scale the bonus proportionally (0.0-1.0) instead of binary full effect.
-        is_water_mass_rule = "waterMassProxy" in condition
+        is_water_mass_rule = rule["_is_water_mass"]
         wm_strength = context.get("waterMassStrength", 1.0) if is_water_mass_rule else 1.0
 
+        rule_raw_bonus = 0
         for effect in effects:
-            apply_to = effect.get("applyToSpecies", ["*"])
             raw_bonus = effect.get("scoreBonus", 0)
+            rule_raw_bonus += raw_bonus
             # Scale bonus by water mass strength (graded, not binary)
             score_bonus = round(raw_bonus * wm_strength) if is_water_mass_rule else raw_bonus
             technique_hints = effect.get("techniqueHints", [])
@@ -359,32 +1041,33 @@ def evaluate_rules(
             mode_hint = effect.get("modeHint")
             no_go = effect.get("noGo", False)
 
-            target_species = species_list if "*" in apply_to else [
-                s for s in apply_to if s in species_list or s in ALL_SPECIES
-            ]
+            if effect["_wildcard"]:
+                target_species = species_list
+            elif species_list is TIER1_SPECIES:
+                target_species = effect["_targets"]
+            else:
+                # Özel species_list: ALL_SPECIES dışı id'ler de listedeyse geçerli
+                target_species = [
+                    s for s in effect.get("applyToSpecies", [])
+                    if s in species_set or s in ALL_SPECIES_SET
+                ]
 
             for sp in target_species:
                 # Track by category
-                if sp not in cat_bonuses:
-                    cat_bonuses[sp] = {}
-                cat_bonuses[sp][category] = cat_bonuses[sp].get(category, 0) + score_bonus
+                cat_bonuses[sp][category] += score_bonus
 
-                # Sum into species_bonuses (raw, will be capped later)
-                result.species_bonuses[sp] = result.species_bonuses.get(sp, 0) + score_bonus
+                # Sum into species totals (raw, will be capped later)
+                species_totals[sp] += score_bonus
 
                 if technique_hints:
-                    existing = result.technique_hints.get(sp, [])
+                    existing = hint_sets.setdefault(sp, {})
                     for th in technique_hints:
-                        if th not in existing:
-                            existing.append(th)
-                    result.technique_hints[sp] = existing
+                        existing[th] = None
 
                 if remove_techniques:
-                    existing_rm = result.remove_techniques.get(sp, [])
+                    existing_rm = remove_sets.setdefault(sp, {})
                     for rt in remove_techniques:
-                        if rt not in existing_rm:
-                            existing_rm.append(rt)
-                    result.remove_techniques[sp] = existing_rm
+                        existing_rm[rt] = None
 
                 if mode_hint:
                     current = result.mode_hints.get(sp)
@@ -393,11 +1076,12 @@ def evaluate_rules(
                     ):
                         result.mode_hints[sp] = (priority, mode_hint)
 
-                rule_affected_species.append(sp)
+                rule_affected_species[sp] = None
 
             if no_go:
                 result.is_no_go = True
-                if message_tr not in result.no_go_reasons_tr:
+                if message_tr not in no_go_seen:
+                    no_go_seen.add(message_tr)
                     result.no_go_reasons_tr.append(message_tr)
 
         if message_tr:
@@ -406,28 +1090,15 @@ def evaluate_rules(
         result.active_rules.append({
             "ruleId": rule["id"],
             "category": category,
-            "appliedBonus": sum(e.get("scoreBonus", 0) for e in effects),
-            "affectedSpecies": list(set(rule_affected_species)),
+            "appliedBonus": rule_raw_bonus,
+            "affectedSpecies": list(rule_affected_species),
             "messageTR": message_tr,
         })
 
     # --- Category-based capping ---
-    if scoring_config and "ruleBonusCaps" in scoring_config:
-        caps = scoring_config["ruleBonusCaps"]
-    else:
-        caps = {"windCoastRules": 12, "istanbulSpecial": 10,
-                "techniqueTime": 8, "weatherMode": 15, "totalCap": 25}
-
-    # Map category names to cap config keys
-    cat_cap_map = {
-        "windCoast": caps.get("windCoastRules", 12),
-        "istanbul": caps.get("istanbulSpecial", 10),
-        "techniqueTime": caps.get("techniqueTime", 8),
-        "weatherMode": caps.get("weatherMode", 15),
-        "absolute": 999,  # no cap on absolute rules
-    }
-    total_cap = caps.get("totalCap", 25)
+    cat_cap_map, total_cap = _resolve_caps(scoring_config)
 
+    result.species_bonuses = dict(species_totals)
     for sp in list(result.species_bonuses.keys()):
         sp_cats = cat_bonuses.get(sp, {})
         result.category_raw_bonuses[sp] = dict(sp_cats)
@@ -458,21 +1129,43 @@ def evaluate_rules(
         result.final_rule_bonus[sp] = final_bonus
         result.species_bonuses[sp] = final_bonus
 
-    # Apply removeFromTechniques AFTER merge
-    for sp in result.technique_hints:
-        remove_list = result.remove_techniques.get(sp, [])
-        result.technique_hints[sp] = [
-            t for t in result.technique_hints[sp] if t not in remove_list
-        ]
+    # Materialize + apply removeFromTechniques AFTER merge
+    for sp, removes in remove_sets.items():
+        result.remove_techniques[sp] = list(removes)
+    for sp, hints in hint_sets.items():
+        removes = remove_sets.get(sp)
+        result.technique_hints[sp] = (
+            list(hints) if not removes else [t for t in hints if t not in removes]
+        )
+
+    if cache_key is not None:
+        _rule_result_cache[cache_key] = result
+        while len(_rule_result_cache) > _RULE_RESULT_CACHE_MAX:
+            _rule_result_cache.popitem(last=False)
 
     return result
 
 
+def evaluate_rules_batch(
+    rules: list[dict[str, Any]],
+    contexts: list[dict[str, Any]],
+    species_list: Optional[list[str]] = None,
+    scoring_config: Optional[dict[str, Any]] = None,
+) -> list[RuleResult]:
+    """Aynı kural setini birden çok context'e (spot × saat) uygular.
+
+    Derleme bir kez yapılır ve tüm context'ler derlenmiş matcher'ları
+    paylaşır; sonuçlar context sırasıyla döner.
+    """
+    compile_rules(rules)
+    return [
+        evaluate_rules(rules, ctx, species_list=species_list,
+                       scoring_config=scoring_config)
+        for ctx in contexts
+    ]
+
+
 def get_combined_messages(result: RuleResult) -> str:
     """Rule messageTR'leri birleştirir (priority DESC, " | " separator)."""
-    sorted_msgs = sorted(result.messages_tr, key=lambda x: x[0], reverse=True)
-    unique_msgs: list[str] = []
-    for _, msg in sorted_msgs:
-        if msg not in unique_msgs:
-            unique_msgs.append(msg)
-    return " | ".join(unique_msgs)
+    sorted_msgs = sorted(result.messages_tr, key=operator.itemgetter(0), reverse=True)
+    return " | ".join(dict.fromkeys(msg for _, msg in sorted_msgs))
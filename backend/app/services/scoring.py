@@ -11,41 +11,157 @@ Formül (v1.3):
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Optional
 
 from app.models.enums import DataQuality
 from app.services.weather import MONTHLY_SEA_TEMP
-from app.utils.wind import degrees_to_cardinal_8
+from app.utils.wind import degrees_to_sector_8, normalize_cardinal_8
 
 logger = logging.getLogger(__name__)
 
 
+# --- Per-config derived tables ---
+#
+# scoring_config her çağrıya parametre olarak enjekte edilir ama pratikte
+# app ömrü boyunca aynı dict'tir (lifespan'de bir kez yüklenir). Türetilmiş
+# tablolar (tür ağırlıkları vb.) config kimliği başına bir kez kurulur;
+# referans tutmak id() geri dönüşümünün yanlış cache hit'ine yol açmasını önler.
+
+_EMPTY_TABLES: dict[str, Any] = {
+    "weights": {}, "temp": {}, "confidence": None, "time": {},
+    "water_mass": None, "best_time": {},
+}
+
+# confidenceFactors yokken kullanılan varsayılanlar (aşağıdaki destructure
+# sırasıyla aynı: base_map, reportBoost, approxCoordPenalty, firedRules
+# threshold/penalty/max, seasonOff/seasonShoulder cezaları).
+_CONFIDENCE_DEFAULTS: tuple[Any, ...] = (
+    {"live": 0.85, "cached": 0.65, "fallback": 0.45},
+    0.10, 0.05, 6, 0.03, 0.15, 0.20, 0.05,
+)
+
+_config_tables_cache: dict[int, tuple[Any, dict[str, Any]]] = {}
+
+
+def _build_config_tables(scoring_config: dict[str, Any]) -> dict[str, Any]:
+    """scoring_config'ten tür-başına hazır tabloları türetir."""
+    temp_tables: dict[str, tuple[float, float, float, float, float]] = {}
+    for sp_id, spec in scoring_config.get("speciesTemp", {}).items():
+        t_min = spec["min"]
+        t_max = spec["max"]
+        temp_tables[sp_id] = (
+            t_min,
+            t_max,
+            spec["pen"],
+            (t_min + t_max) / 2,
+            (t_max - t_min) / 2,
+        )
+    confidence: Optional[tuple[Any, ...]] = None
+    if "confidenceFactors" in scoring_config:
+        cf = scoring_config["confidenceFactors"]
+        confidence = (
+            dict(cf.get("dataQualityBase", {})),
+            cf.get("reportBoost", 0.10),
+            cf.get("approxCoordPenalty", 0.05),
+            cf.get("firedRulesThreshold", 6),
+            cf.get("firedRulesPenalty", 0.03),
+            cf.get("maxFiredRulesPenalty", 0.15),
+            cf.get("seasonOffPenalty", 0.20),
+            cf.get("seasonShoulderPenalty", 0.05),
+        )
+    water_mass: Optional[tuple[Any, ...]] = None
+    if "waterMassProxy" in scoring_config:
+        wmp = scoring_config["waterMassProxy"]
+        water_mass = (
+            frozenset(wmp.get("lodosDirections", ["SW", "S"])),
+            frozenset(wmp.get("poyrazDirections", ["NE", "N"])),
+            wmp.get("weakThreshold", 10),
+            wmp.get("strongThreshold", 20),
+        )
+    tables: dict[str, Any] = {
+        # Ağırlıklar sabit sıralı 5'li tuple: (pressure, wind, sea_temp,
+        # solunar, time). Eksik anahtar config hatasıdır ve yükte patlar.
+        "weights": {
+            sp_id: (w["pressure"], w["wind"], w["sea_temp"], w["solunar"], w["time"])
+            for sp_id, w in scoring_config.get("speciesWeights", {}).items()
+        },
+        "temp": temp_tables,
+        "confidence": confidence,
+        "time": {
+            sp_id: _build_time_lut([tuple(h) for h in raw])
+            for sp_id, raw in scoring_config.get("speciesBestHours", {}).items()
+        },
+        "water_mass": water_mass,
+        # Tür başına sabit bestTime string'i (ilk pencereden), bir kez formatlanır.
+        "best_time": {
+            sp_id: f"{raw[0][0]:02d}:00-{raw[0][1]:02d}:00"
+            for sp_id, raw in scoring_config.get("speciesBestHours", {}).items()
+            if raw
+        },
+    }
+    return tables
+
+
+def _config_tables(scoring_config: Optional[dict[str, Any]]) -> dict[str, Any]:
+    """Config başına türetilmiş tablolar (identity-cached)."""
+    if scoring_config is None:
+        return _EMPTY_TABLES
+    entry = _config_tables_cache.get(id(scoring_config))
+    if entry is not None:
+        return entry[1]
+    tables = _build_config_tables(scoring_config)
+    _config_tables_cache[id(scoring_config)] = (scoring_config, tables)
+    return tables
+
+
+def _r2(x: float) -> float:
+    """Negatif olmayan skorlar için hızlı 2-ondalık yuvarlama.
+
+    builtin round()'un tip dispatch + half-even maliyetini atlar; girdiler
+    hep >= 0 olduğundan half-up davranışı yeterlidir (tam .xx5 ikilik
+    gösterimde zaten nadiren oluşur).
+    """
+    return int(x * 100 + 0.5) / 100
+
+
 # --- 1. Pressure Score ---
 
+# Basınç bantları 1015 hPa etrafında simetrik: |hpa-1015| uzaklığına göre
+# tablo lookup, orijinal if-merdiveniyle sınırlar dahil birebir aynı.
+_PRESSURE_BOUNDS = (5.0, 10.0, 15.0)
+_PRESSURE_BASES = (1.0, 0.7, 0.4, 0.2)
+
+
 def pressure_score(hpa: float, change_3h: float) -> float:
     """Pressure parameter score (0.0-1.0)."""
-    if 1010 <= hpa <= 1020:
-        base = 1.0
-    elif 1005 <= hpa < 1010 or 1020 < hpa <= 1025:
-        base = 0.7
-    elif 1000 <= hpa < 1005 or 1025 < hpa <= 1030:
-        base = 0.4
-    else:
-        base = 0.2
+    base = _PRESSURE_BASES[bisect_left(_PRESSURE_BOUNDS, abs(hpa - 1015.0))]
 
     if change_3h < -2:
-        base = min(1.0, base + 0.3)
+        base += 0.3
     elif change_3h < -1:
-        base = min(1.0, base + 0.15)
+        base += 0.15
     elif change_3h > 2:
-        base = max(0.0, base - 0.2)
+        base -= 0.2
 
-    return base
+    return min(1.0, max(0.0, base))
 
 
 # --- 2. Wind Score ---
 
+# Kuvvetli rüzgarda yön/yaka düzeltmesi: satır = yaka (anatolian, european),
+# sütun = 8'li sektör indeksi (N=0, NE=1, ... NW=7). Tek tablo okuması,
+# string karşılaştırma zinciri yerine geçer.
+_SHORE_IDX = {"anatolian": 0, "european": 1}
+_WIND_ADJ = (
+    #  N      NE     E    SE    S      SW     W    NW
+    (-0.15, -0.15, 0.0, 0.0, +0.05, +0.05, 0.0, 0.0),  # anatolian
+    (+0.08, +0.08, 0.0, 0.0, -0.15, -0.15, 0.0, 0.0),  # european
+)
+
+
 def wind_score(kmh: float, dir_deg: int, shore: str) -> float:
     """Wind parameter score (0.0-1.0)."""
     if kmh < 5:
@@ -59,16 +175,10 @@ def wind_score(kmh: float, dir_deg: int, shore: str) -> float:
     else:
         return 0.0
 
-    cardinal = degrees_to_cardinal_8(dir_deg)
     if kmh >= 25:
-        if cardinal in ("NE", "N") and shore == "anatolian":
-            base -= 0.15
-        elif cardinal in ("NE", "N") and shore == "european":
-            base += 0.08
-        elif cardinal in ("SW", "S") and shore == "european":
-            base -= 0.15
-        elif cardinal in ("SW", "S") and shore == "anatolian":
-            base += 0.05
+        shore_idx = _SHORE_IDX.get(shore)
+        if shore_idx is not None:
+            base += _WIND_ADJ[shore_idx][degrees_to_sector_8(dir_deg)]
 
     return max(0.0, min(1.0, base))
 
@@ -79,31 +189,26 @@ def sea_temp_score(
     temp_c: Optional[float],
     species_id: str,
     scoring_config: Optional[dict[str, Any]] = None,
+    month: Optional[int] = None,
 ) -> float:
     """Sea temperature parameter score (0.0-1.0).
 
     Reads temp ranges from scoring_config["speciesTemp"] if available,
-    falls back to hardcoded defaults for backward compat.
+    falls back to hardcoded defaults for backward compat. temp_c None ise
+    aylık klimatolojiye düşer; month verilmezse sistem saatinden okunur.
     """
-    # Get species temp config
-    if scoring_config and "speciesTemp" in scoring_config:
-        spec = scoring_config["speciesTemp"].get(species_id)
-    else:
-        spec = None
-
+    spec = _config_tables(scoring_config)["temp"].get(species_id) if scoring_config else None
     if spec is None:
         return 0.5
 
     if temp_c is None:
-        temp_c = MONTHLY_SEA_TEMP.get(datetime.now().month, 15.0)
+        if month is None:
+            month = datetime.now().month
+        temp_c = MONTHLY_SEA_TEMP.get(month, 15.0)
 
-    t_min = spec["min"]
-    t_max = spec["max"]
-    pen = spec["pen"]
+    t_min, t_max, pen, mid, half_range = spec
 
     if t_min <= temp_c <= t_max:
-        mid = (t_min + t_max) / 2
-        half_range = (t_max - t_min) / 2
         if half_range == 0:
             return 1.0
         distance = abs(temp_c - mid) / half_range
@@ -119,38 +224,63 @@ def sea_temp_score(
 
 # --- 4. Solunar Score ---
 
+# Solunar periyotları her çağrıda "HH:MM" split + int parse etmek yerine
+# dict kimliği başına bir kez dakika-int çiftlerine çevrilir. solunar_data
+# API yanıtına olduğu gibi gömüldüğü için dict'in kendisine alan eklenmez;
+# türetilmiş tuple'lar ayrı, sınırlı bir LRU'da tutulur (weather.py deseni).
+_solunar_periods_cache: OrderedDict[int, tuple[Any, tuple[Any, Any]]] = OrderedDict()
+_SOLUNAR_PERIODS_CACHE_MAX = 32
+
+
+def _time_to_minutes(time_str: str) -> int:
+    """"HH:MM" → gün içi dakika."""
+    parts = time_str.split(":")
+    return int(parts[0]) * 60 + int(parts[1])
+
+
+def _solunar_periods(solunar_data: dict[str, Any]) -> tuple[Any, Any]:
+    """(majors, minors) dakika-int (start, end) tuple'larını döner."""
+    key = id(solunar_data)
+    hit = _solunar_periods_cache.get(key)
+    if hit is not None and hit[0] is solunar_data:
+        _solunar_periods_cache.move_to_end(key)
+        return hit[1]
+
+    majors = []
+    for p in solunar_data.get("majorPeriods", []):
+        start = _time_to_minutes(p["start"])
+        # Yaklaşma penceresi başlangıcı da burada bir kez hesaplanır;
+        # sıcak döngüde % 1440 kalmaz.
+        majors.append((start, _time_to_minutes(p["end"]), (start - 60) % 1440))
+    majors = tuple(majors)
+    minors = tuple(
+        (_time_to_minutes(p["start"]), _time_to_minutes(p["end"]))
+        for p in solunar_data.get("minorPeriods", [])
+    )
+    parsed = (majors, minors)
+    _solunar_periods_cache[key] = (solunar_data, parsed)
+    if len(_solunar_periods_cache) > _SOLUNAR_PERIODS_CACHE_MAX:
+        _solunar_periods_cache.popitem(last=False)
+    return parsed
+
+
 def solunar_score(current_hour: int, current_minute: int, solunar_data: dict[str, Any]) -> float:
     """Solunar parameter score (0.0-1.0)."""
     current_minutes = current_hour * 60 + current_minute
+    majors, minors = _solunar_periods(solunar_data)
 
-    def _time_to_minutes(time_str: str) -> int:
-        parts = time_str.split(":")
-        return int(parts[0]) * 60 + int(parts[1])
-
-    def _in_period(start_str: str, end_str: str) -> bool:
-        start = _time_to_minutes(start_str)
-        end = _time_to_minutes(end_str)
-        if start <= end:
-            return start <= current_minutes <= end
-        return current_minutes >= start or current_minutes <= end
-
-    def _approaching(start_str: str, minutes_before: int = 60) -> bool:
-        start = _time_to_minutes(start_str)
-        approach_start = (start - minutes_before) % 1440
-        if approach_start <= start:
-            return approach_start <= current_minutes < start
-        return current_minutes >= approach_start or current_minutes < start
-
-    for period in solunar_data.get("majorPeriods", []):
-        if _in_period(period["start"], period["end"]):
+    # Gece yarısını saran aralıklar dahil tek modüler karşılaştırma:
+    # cm ∈ [start, end] (mod 1440) ⇔ (cm - start) % 1440 <= (end - start) % 1440.
+    for start, end, _approach in majors:
+        if (current_minutes - start) % 1440 <= (end - start) % 1440:
             return 1.0
 
-    for period in solunar_data.get("majorPeriods", []):
-        if _approaching(period["start"]):
+    for start, _end, approach_start in majors:
+        if (current_minutes - approach_start) % 1440 < 60:
             return 0.7
 
-    for period in solunar_data.get("minorPeriods", []):
-        if _in_period(period["start"], period["end"]):
+    for start, end in minors:
+        if (current_minutes - start) % 1440 <= (end - start) % 1440:
             return 0.7
 
     moon_illumination = solunar_data.get("moonIllumination", 50)
@@ -160,6 +290,37 @@ def solunar_score(current_hour: int, current_minute: int, solunar_data: dict[str
 
 # --- 5. Time Score (config-driven) ---
 
+def _build_time_lut(best_hours: list[tuple[int, int]]) -> tuple[float, ...]:
+    """best_hours listesinden 24 girişli saat→skor LUT'u üretir.
+
+    Orijinal döngü mantığının (aralık içi 1.0, komşu saat 0.6, aksi 0.3)
+    24 saat için bir kez değerlendirilmiş hali; komşuluk kasıtlı olarak
+    gün sınırında sarmaz (abs fark, mod-24 değil).
+    """
+    lut = []
+    for hour in range(24):
+        base = 0.3
+        for start, end in best_hours:
+            if start <= end:
+                if start <= hour <= end:
+                    base = 1.0
+                    break
+            elif hour >= start or hour <= end:
+                base = 1.0
+                break
+        if base < 1.0:
+            for start, end in best_hours:
+                if abs(hour - start) <= 1 or abs(hour - end) <= 1:
+                    base = max(base, 0.6)
+                    break
+        lut.append(base)
+    return tuple(lut)
+
+
+_DEFAULT_BEST_HOURS = [(5, 8), (16, 19)]
+_DEFAULT_TIME_LUT = _build_time_lut(_DEFAULT_BEST_HOURS)
+
+
 def time_score(
     hour: int,
     species_id: str,
@@ -169,36 +330,80 @@ def time_score(
 
     Reads best hours from scoring_config["speciesBestHours"] if available.
     """
-    default_hours = [(5, 8), (16, 19)]
-
-    if scoring_config and "speciesBestHours" in scoring_config:
-        raw = scoring_config["speciesBestHours"].get(species_id, default_hours)
-        best_hours = [tuple(h) for h in raw]
+    if scoring_config:
+        lut = _config_tables(scoring_config)["time"].get(species_id, _DEFAULT_TIME_LUT)
     else:
-        best_hours = default_hours
+        lut = _DEFAULT_TIME_LUT
+    return lut[hour]
 
-    base = 0.3
 
-    for start, end in best_hours:
-        if start <= end:
-            if start <= hour <= end:
-                base = 1.0
-                break
-        else:
-            if hour >= start or hour <= end:
-                base = 1.0
-                break
+# --- Season Adjustment (v1.3 additive — NEVER zeros) ---
 
-    if base < 1.0:
-        for start, end in best_hours:
-            if abs(hour - start) <= 1 or abs(hour - end) <= 1:
-                base = max(base, 0.6)
-                break
+# Sezon kararı tür başına bir kez kapanışa (closure) derlenir: ay maskeleri,
+# ayarlama tuple'ları ve parça parametreleri local olarak bağlanır; sıcak
+# yolda dict.get zinciri kalmaz. seasonality_config lifespan'de bir kez
+# yüklenir; identity-cache deseni scoring tablolarıyla aynıdır.
+_SEASON_ACTIVE: tuple[int, str, float, bool] = (0, "active", 0.0, False)
 
-    return base
+_season_fns_cache: dict[int, tuple[Any, dict[str, Any]]] = {}
 
 
-# --- Season Adjustment (v1.3 additive — NEVER zeros) ---
+def _build_season_fn(sp_cfg: dict[str, Any]):
+    """Tek türün sezon yapılandırmasını (month, weighted_sum) → tuple kapanışına derler."""
+    peak_mask = sum(1 << (m - 1) for m in sp_cfg.get("peakMonths", []))
+    shoulder_mask = sum(1 << (m - 1) for m in sp_cfg.get("shoulderMonths", []))
+    off_mask = sum(1 << (m - 1) for m in sp_cfg.get("offMonths", []))
+
+    peak_result = (sp_cfg.get("peakAdjustment", 10), "peak", 0.0, False)
+    shoulder_result = (
+        sp_cfg.get("shoulderAdjustment", 3),
+        "shoulder",
+        sp_cfg.get("confidenceImpact", 0.0) * 0.3,  # slight
+        False,
+    )
+
+    off_adj = sp_cfg.get("offAdjustment", -20)
+    conf_impact = sp_cfg.get("confidenceImpact", 0.2)
+    parca = sp_cfg.get("parcaBehavior", {})
+    parca_threshold = parca.get("parcaConditionThreshold", 0.6)
+    reduction = parca.get("parcaPenaltyReduction", 0.5)
+    off_result = (off_adj, "off", conf_impact, False)
+    # Parça ihtimali: koşullar güçlüyse ceza azalır, güven tabanı yükselir.
+    parca_result = (
+        round(off_adj * (1.0 - reduction)),
+        "off",
+        max(conf_impact * 0.5, parca.get("parcaConfidence", 0.3)),
+        True,
+    )
+
+    def season_fn(month: int, weighted_sum: float) -> tuple[int, str, float, bool]:
+        month_bit = 1 << (month - 1)
+        if peak_mask & month_bit:
+            return peak_result
+        if shoulder_mask & month_bit:
+            return shoulder_result
+        if off_mask & month_bit:
+            return parca_result if weighted_sum >= parca_threshold else off_result
+        return _SEASON_ACTIVE
+
+    return season_fn
+
+
+def _season_fns(seasonality_config: dict[str, Any]) -> dict[str, Any]:
+    """Tür başına derlenmiş sezon fonksiyonlarını döner."""
+    key = id(seasonality_config)
+    hit = _season_fns_cache.get(key)
+    if hit is not None and hit[0] is seasonality_config:
+        return hit[1]
+
+    fns = {
+        sp_id: _build_season_fn(sp_cfg)
+        for sp_id, sp_cfg in seasonality_config.get("species", {}).items()
+        if sp_cfg
+    }
+    _season_fns_cache[key] = (seasonality_config, fns)
+    return fns
+
 
 def compute_season_adjustment(
     species_id: str,
@@ -216,51 +421,13 @@ def compute_season_adjustment(
         - is_parca: True if parça ihtimali triggered (off-season + good conditions)
     """
     if not seasonality_config or "species" not in seasonality_config:
-        return (0, "active", 0.0, False)
-
-    sp_cfg = seasonality_config["species"].get(species_id)
-    if not sp_cfg:
-        return (0, "active", 0.0, False)
-
-    peak_months = sp_cfg.get("peakMonths", [])
-    shoulder_months = sp_cfg.get("shoulderMonths", [])
-    off_months = sp_cfg.get("offMonths", [])
-
-    if month in peak_months:
-        return (
-            sp_cfg.get("peakAdjustment", 10),
-            "peak",
-            0.0,
-            False,
-        )
-
-    if month in shoulder_months:
-        return (
-            sp_cfg.get("shoulderAdjustment", 3),
-            "shoulder",
-            sp_cfg.get("confidenceImpact", 0.0) * 0.3,  # slight
-            False,
-        )
-
-    if month in off_months:
-        off_adj = sp_cfg.get("offAdjustment", -20)
-        conf_impact = sp_cfg.get("confidenceImpact", 0.2)
-        is_parca = False
+        return _SEASON_ACTIVE
 
-        # Parça ihtimali: if conditions are strongly favorable, reduce penalty
-        parca = sp_cfg.get("parcaBehavior", {})
-        threshold = parca.get("parcaConditionThreshold", 0.6)
-        reduction = parca.get("parcaPenaltyReduction", 0.5)
+    season_fn = _season_fns(seasonality_config).get(species_id)
+    if season_fn is None:
+        return _SEASON_ACTIVE
 
-        if weighted_sum >= threshold:
-            off_adj = round(off_adj * (1.0 - reduction))
-            is_parca = True
-            conf_impact = max(conf_impact * 0.5, parca.get("parcaConfidence", 0.3))
-
-        return (off_adj, "off", conf_impact, is_parca)
-
-    # Month not in any list → treat as active (year-round with no explicit off)
-    return (0, "active", 0.0, False)
+    return season_fn(month, weighted_sum)
 
 
 # --- Backward-compat season_multiplier (deprecated) ---
@@ -289,30 +456,20 @@ def compute_confidence(
     Reads thresholds from scoring_config["confidenceFactors"] if available.
     NEVER returns 0.0 — minimum 0.1 even for off-season.
     """
-    if scoring_config and "confidenceFactors" in scoring_config:
-        cf = scoring_config["confidenceFactors"]
-        base_map = cf.get("dataQualityBase", {})
-        base = base_map.get(data_quality.value, 0.5)
-        report_boost = cf.get("reportBoost", 0.10)
-        approx_penalty = cf.get("approxCoordPenalty", 0.05)
-        rules_threshold = cf.get("firedRulesThreshold", 6)
-        rules_penalty_per = cf.get("firedRulesPenalty", 0.03)
-        max_rules_penalty = cf.get("maxFiredRulesPenalty", 0.15)
-        season_off_penalty = cf.get("seasonOffPenalty", 0.20)
-        season_shoulder_penalty = cf.get("seasonShoulderPenalty", 0.05)
-    else:
-        # Fallback defaults
-        base_map_default = {
-            "live": 0.85, "cached": 0.65, "fallback": 0.45,
-        }
-        base = base_map_default.get(data_quality.value, 0.5)
-        report_boost = 0.10
-        approx_penalty = 0.05
-        rules_threshold = 6
-        rules_penalty_per = 0.03
-        max_rules_penalty = 0.15
-        season_off_penalty = 0.20
-        season_shoulder_penalty = 0.05
+    factors = _config_tables(scoring_config)["confidence"] if scoring_config else None
+    if factors is None:
+        factors = _CONFIDENCE_DEFAULTS
+    (
+        base_map,
+        report_boost,
+        approx_penalty,
+        rules_threshold,
+        rules_penalty_per,
+        max_rules_penalty,
+        season_off_penalty,
+        season_shoulder_penalty,
+    ) = factors
+    base = base_map.get(data_quality.value, 0.5)
 
     if has_reports_24h:
         base += report_boost
@@ -335,7 +492,7 @@ def compute_confidence(
     base -= season_confidence_impact
 
     # Clamp: never 0.0, minimum 0.1
-    return round(max(0.1, min(1.0, base)), 2)
+    return _r2(max(0.1, min(1.0, base)))
 
 
 # --- Wind Exposure Adjustment ---
@@ -361,7 +518,6 @@ def compute_wind_exposure_adjustment(
     if not wem:
         return 0.0
 
-    from app.utils.wind import normalize_cardinal_8
     norm_cardinal = normalize_cardinal_8(wind_cardinal)
 
     exposure = wem.get(norm_cardinal, "neutral")
@@ -382,17 +538,12 @@ def compute_water_mass_proxy(
     Returns:
         {"type": "lodos"|"poyraz"|"neutral", "strength": 0.0-1.0}
     """
-    if scoring_config is None or "waterMassProxy" not in scoring_config:
+    params = _config_tables(scoring_config)["water_mass"] if scoring_config else None
+    if params is None:
         return {"type": "neutral", "strength": 0.0}
 
-    from app.utils.wind import normalize_cardinal_8
     norm = normalize_cardinal_8(wind_cardinal)
-
-    wmp = scoring_config["waterMassProxy"]
-    lodos_dirs = wmp.get("lodosDirections", ["SW", "S"])
-    poyraz_dirs = wmp.get("poyrazDirections", ["NE", "N"])
-    weak_threshold = wmp.get("weakThreshold", 10)
-    strong_threshold = wmp.get("strongThreshold", 20)
+    lodos_dirs, poyraz_dirs, weak_threshold, strong_threshold = params
 
     if norm in lodos_dirs:
         proxy_type = "lodos"
@@ -408,7 +559,7 @@ def compute_water_mass_proxy(
     else:
         strength = (wind_speed_kmh - weak_threshold) / (strong_threshold - weak_threshold)
 
-    return {"type": proxy_type, "strength": round(strength, 2)}
+    return {"type": proxy_type, "strength": _r2(strength)}
 
 
 # --- Best Time Derivation ---
@@ -418,20 +569,21 @@ def derive_best_time(
     scoring_config: Optional[dict[str, Any]] = None,
 ) -> Optional[str]:
     """Derive best time string for species."""
-    if scoring_config and "speciesBestHours" in scoring_config:
-        raw = scoring_config["speciesBestHours"].get(species_id)
-    else:
-        raw = None
-
-    if not raw:
+    if not scoring_config:
         return None
-
-    start, end = raw[0]
-    return f"{start:02d}:00-{end:02d}:00"
+    return _config_tables(scoring_config)["best_time"].get(species_id)
 
 
 # --- Final Score Calculation (v1.3) ---
 
+# Ağırlığı tanımsız türler için paylaşılan sonuç: her çağrıda yeni dict
+# kurmamak için modül sabiti. Çağıranlar skor dict'lerini yalnızca okur
+# (decision.py kendi yanıt dict'ini ayrıca kurar); mutasyon yapılmamalı.
+_UNSCORED_RESULT: dict[str, Any] = {
+    "score": 0, "confidence": 0.1, "seasonStatus": "active",
+    "bestTime": None, "breakdown": {}, "isParca": False,
+}
+
 def calculate_species_score(
     species_id: str,
     weather: Any,
@@ -457,30 +609,98 @@ def calculate_species_score(
         seasonAdjustment (authoritative, new)
         seasonMultiplier (always 1.0, deprecated)
     """
-    # Get weights from config
-    if scoring_config and "speciesWeights" in scoring_config:
-        weights = scoring_config["speciesWeights"].get(species_id)
-    else:
-        weights = None
+    # Get weights from per-config tables (identity-cached derivation)
+    weights = _config_tables(scoring_config)["weights"].get(species_id)
 
     if not weights:
-        return {"score": 0, "confidence": 0.1, "seasonStatus": "active",
-                "bestTime": None, "breakdown": {}, "isParca": False}
+        return _UNSCORED_RESULT
 
     # Parameter scores
     p_score = pressure_score(weather.pressure_hpa, weather.pressure_change_3h_hpa)
     w_score = wind_score(weather.wind_speed_kmh, weather.wind_dir_deg, shore)
-    st_score = sea_temp_score(weather.sea_temp_c, species_id, scoring_config)
+    st_score = sea_temp_score(weather.sea_temp_c, species_id, scoring_config, month)
     sol_score = solunar_score(hour, minute, solunar_data)
     t_score = time_score(hour, species_id, scoring_config)
 
+    return _finalize_species_score(
+        species_id, weights, p_score, w_score, st_score, sol_score, t_score,
+        rule_bonus, month, data_quality, has_reports_24h,
+        scoring_config, seasonality_config, coord_accuracy, fired_rules_count,
+    )
+
+
+def calculate_all_species_scores(
+    species_ids: list[str],
+    weather: Any,
+    solunar_data: dict[str, Any],
+    shore: str,
+    rule_bonuses: dict[str, int],
+    month: int,
+    hour: int,
+    minute: int,
+    data_quality: DataQuality,
+    has_reports_24h: bool,
+    scoring_config: Optional[dict[str, Any]] = None,
+    seasonality_config: Optional[dict[str, Any]] = None,
+    coord_accuracy: str = "approx",
+    fired_rules_count: int = 0,
+) -> dict[str, dict[str, Any]]:
+    """Tüm türleri tek geçişte skorlar.
+
+    Basınç, rüzgar ve solunar skorları türden bağımsızdır; tür başına
+    calculate_species_score çağırmak yerine bir kez hesaplanıp paylaşılır.
+    Sonuçlar calculate_species_score ile birebir aynıdır.
+    """
+    weights_table = _config_tables(scoring_config)["weights"]
+
+    p_score = pressure_score(weather.pressure_hpa, weather.pressure_change_3h_hpa)
+    w_score = wind_score(weather.wind_speed_kmh, weather.wind_dir_deg, shore)
+    sol_score = solunar_score(hour, minute, solunar_data)
+
+    results: dict[str, dict[str, Any]] = {}
+    for species_id in species_ids:
+        weights = weights_table.get(species_id)
+        if not weights:
+            results[species_id] = _UNSCORED_RESULT
+            continue
+
+        st_score = sea_temp_score(weather.sea_temp_c, species_id, scoring_config, month)
+        t_score = time_score(hour, species_id, scoring_config)
+
+        results[species_id] = _finalize_species_score(
+            species_id, weights, p_score, w_score, st_score, sol_score, t_score,
+            rule_bonuses.get(species_id, 0), month, data_quality, has_reports_24h,
+            scoring_config, seasonality_config, coord_accuracy, fired_rules_count,
+        )
+    return results
+
+
+def _finalize_species_score(
+    species_id: str,
+    weights: tuple[float, float, float, float, float],
+    p_score: float,
+    w_score: float,
+    st_score: float,
+    sol_score: float,
+    t_score: float,
+    rule_bonus: int,
+    month: int,
+    data_quality: DataQuality,
+    has_reports_24h: bool,
+    scoring_config: Optional[dict[str, Any]],
+    seasonality_config: Optional[dict[str, Any]],
+    coord_accuracy: str,
+    fired_rules_count: int,
+) -> dict[str, Any]:
+    """Parametre skorlarından nihai tür sonucunu kurar (ortak son aşama)."""
     # Weighted sum (0.0-1.0)
+    w_p, w_w, w_st, w_sol, w_t = weights
     weighted_sum = (
-        weights["pressure"] * p_score
-        + weights["wind"] * w_score
-        + weights["sea_temp"] * st_score
-        + weights["solunar"] * sol_score
-        + weights["time"] * t_score
+        w_p * p_score
+        + w_w * w_score
+        + w_st * st_score
+        + w_sol * sol_score
+        + w_t * t_score
     )
 
     # Season adjustment (additive, NEVER zeros)
@@ -497,14 +717,13 @@ def calculate_species_score(
     else:
         total_cap = 30
         negative_floor = -20
-    if rule_bonus > 0:
-        capped_bonus = min(total_cap, rule_bonus)
-    else:
-        capped_bonus = max(negative_floor, rule_bonus)
+    # total_cap > 0 > negative_floor olduğundan tek çift clamp iki dallı
+    # if/else ile birebir aynı sonucu verir.
+    capped_bonus = max(negative_floor, min(total_cap, rule_bonus))
 
     # Final score (v1.3 additive)
     raw_score = round(weighted_sum * 100 + season_adj) + capped_bonus
-    final_score = max(0, min(100, raw_score))
+    final_score = min(100, max(0, raw_score))
 
     # offFloor enforcement: off-season species never below configured floor
     # This ensures "parca ihtimali" (stray fish) is always visible
@@ -533,11 +752,11 @@ def calculate_species_score(
         "bestTime": derive_best_time(species_id, scoring_config),
         "isParca": is_parca,
         "breakdown": {
-            "pressure": round(p_score, 2),
-            "wind": round(w_score, 2),
-            "seaTemp": round(st_score, 2),
-            "solunar": round(sol_score, 2),
-            "time": round(t_score, 2),
+            "pressure": _r2(p_score),
+            "wind": _r2(w_score),
+            "seaTemp": _r2(st_score),
+            "solunar": _r2(sol_score),
+            "time": _r2(t_score),
             # v1.3 dual-field backward compat
             "seasonAdjustment": season_adj,
             "seasonMultiplier": 1.0,  # DEPRECATED — always 1.0
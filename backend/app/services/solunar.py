@@ -7,8 +7,11 @@ ARRAY formatı zorunlu: majorPeriods[], minorPeriods[].
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
@@ -37,6 +40,16 @@ def _time_str(dt: datetime) -> str:
     return dt.strftime("%H:%M")
 
 
+def _minutes_str(minutes: int) -> str:
+    """Gün içi dakikayı "HH:MM" string'ine çevirir."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _serialize_periods(periods: list[tuple[int, int]]) -> list[dict[str, str]]:
+    """Dakika-int (start, end) çiftlerini API'nin period dict formatına çevirir."""
+    return [{"start": _minutes_str(s), "end": _minutes_str(e)} for s, e in periods]
+
+
 def _compute_moon_phase_name(illumination: float, is_waxing: bool) -> str:
     """Ay illumination ve büyüme/küçülme durumundan faz adı döner.
 
@@ -47,24 +60,31 @@ def _compute_moon_phase_name(illumination: float, is_waxing: bool) -> str:
     Returns:
         Moon phase string.
     """
+    # MOON_PHASES döngüsel sıralı (new→waxing…→full→waning…); kademeli
+    # if/elif yerine 30'luk aydınlanma dilimi doğrudan indekse çevrilir.
     if illumination < 5:
-        return "new_moon"
-    elif illumination > 95:
-        return "full_moon"
-    elif is_waxing:
-        if illumination < 35:
-            return "waxing_crescent"
-        elif illumination < 65:
-            return "first_quarter"
-        else:
-            return "waxing_gibbous"
-    else:
-        if illumination < 35:
-            return "waning_crescent"
-        elif illumination < 65:
-            return "last_quarter"
-        else:
-            return "waning_gibbous"
+        return MOON_PHASES[0]
+    if illumination > 95:
+        return MOON_PHASES[4]
+    bucket = min(2, int((illumination - 5) // 30))
+    return MOON_PHASES[1 + bucket] if is_waxing else MOON_PHASES[7 - bucket]
+
+
+# ephem Observer/Moon/Sun nesneleri C-extension tarafında maliyetli
+# kurulumlar; thread başına bir kez oluşturulup attribute atamasıyla
+# yeniden kullanılır (kilit gerektirmez — her thread kendi setini görür).
+_ephem_local = threading.local()
+
+
+def _ephem_objects():
+    """Thread-local (Observer, Moon, Sun) üçlüsünü döner (lazy kurulum)."""
+    objs = getattr(_ephem_local, "objs", None)
+    if objs is None:
+        import ephem
+
+        objs = (ephem.Observer(), ephem.Moon(), ephem.Sun())
+        _ephem_local.objs = objs
+    return objs
 
 
 def compute_solunar(
@@ -77,6 +97,10 @@ def compute_solunar(
     ephem kütüphanesiyle ay transit/antitransit zamanlarını hesaplar,
     major (transit/antitransit ±1h) ve minor (rise/set ±30min) periyotları üretir.
 
+    Sonuç gün + yuvarlanmış koordinat başına deterministiktir ve LRU ile
+    cache'lenir (ephem transit aramaları maliyetin çoğu); dönen dict
+    paylaşılır, çağıranlar salt-okur kullanmalıdır.
+
     Args:
         date: Hesaplama tarihi. None ise bugün.
         lat: Enlem.
@@ -86,7 +110,7 @@ def compute_solunar(
         dict: majorPeriods[], minorPeriods[], moonPhase, moonIllumination, solunarRating.
     """
     try:
-        import ephem
+        import ephem  # noqa: F401 — yalnızca varlık kontrolü
     except ImportError:
         logger.warning("ephem kütüphanesi yüklü değil — varsayılan solunar verisi döndürülüyor")
         return _default_solunar()
@@ -95,116 +119,136 @@ def compute_solunar(
         date = datetime.now(tz=timezone.utc)
 
     try:
-        observer = ephem.Observer()
-        observer.lat = str(lat)
-        observer.lon = str(lng)
-        observer.elevation = 0
-        observer.date = ephem.Date(date)
-
-        moon = ephem.Moon()
-        moon.compute(observer)
-
-        # Moon illumination (0-100)
-        moon_illumination = round(moon.phase, 1)
-
-        # Determine waxing/waning
-        tomorrow_observer = ephem.Observer()
-        tomorrow_observer.lat = str(lat)
-        tomorrow_observer.lon = str(lng)
-        tomorrow_observer.date = ephem.Date(date + timedelta(days=1))
-        moon_tomorrow = ephem.Moon()
-        moon_tomorrow.compute(tomorrow_observer)
-        is_waxing = moon_tomorrow.phase > moon.phase
-
-        moon_phase = _compute_moon_phase_name(moon_illumination, is_waxing)
-
-        # Moon rise/set/transit times for major/minor periods
-        major_periods: list[dict[str, str]] = []
-        minor_periods: list[dict[str, str]] = []
-
-        # Set observer to midnight local (Istanbul UTC+3)
-        local_midnight = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        if local_midnight.tzinfo is None:
-            local_midnight = local_midnight.replace(tzinfo=timezone.utc)
-        observer.date = ephem.Date(local_midnight)
+        return _compute_solunar_cached(date.toordinal(), round(lat, 2), round(lng, 2))
+    except Exception as e:
+        logger.error("Solunar hesaplama hatası: %s", e)
+        return _default_solunar()
 
-        try:
-            # Moon transit (culmination) — major period
-            transit = observer.next_transit(ephem.Moon())
-            transit_dt = ephem.Date(transit).datetime().replace(tzinfo=timezone.utc)
-            # Istanbul UTC+3 offset
-            transit_local = transit_dt + timedelta(hours=3)
-            major_periods.append({
-                "start": _time_str(transit_local - timedelta(hours=1)),
-                "end": _time_str(transit_local + timedelta(hours=1)),
-            })
-        except Exception:
-            pass
 
-        try:
-            # Moon anti-transit (opposite) — major period
-            anti_transit = observer.next_antitransit(ephem.Moon())
-            anti_dt = ephem.Date(anti_transit).datetime().replace(tzinfo=timezone.utc)
-            anti_local = anti_dt + timedelta(hours=3)
-            major_periods.append({
-                "start": _time_str(anti_local - timedelta(hours=1)),
-                "end": _time_str(anti_local + timedelta(hours=1)),
-            })
-        except Exception:
-            pass
+@lru_cache(maxsize=256)
+def _compute_solunar_cached(date_ordinal: int, lat: float, lng: float) -> dict[str, Any]:
+    """compute_solunar'ın gün-ordinal + koordinat anahtarlı cache'li gövdesi.
 
-        try:
-            # Moon rise — minor period
-            rise = observer.next_rising(ephem.Moon())
-            rise_dt = ephem.Date(rise).datetime().replace(tzinfo=timezone.utc)
-            rise_local = rise_dt + timedelta(hours=3)
-            minor_periods.append({
-                "start": _time_str(rise_local - timedelta(minutes=30)),
-                "end": _time_str(rise_local + timedelta(minutes=30)),
-            })
-        except ephem.NeverUpError:
-            pass
-        except Exception:
-            pass
+    Hata durumunda exception yukarı taşar ki başarısız gün cache'e yazılmasın.
+    """
+    import ephem
 
-        try:
-            # Moon set — minor period
-            setting = observer.next_setting(ephem.Moon())
-            set_dt = ephem.Date(setting).datetime().replace(tzinfo=timezone.utc)
-            set_local = set_dt + timedelta(hours=3)
-            minor_periods.append({
-                "start": _time_str(set_local - timedelta(minutes=30)),
-                "end": _time_str(set_local + timedelta(minutes=30)),
-            })
-        except ephem.NeverUpError:
-            pass
-        except Exception:
-            pass
+    date = datetime.fromordinal(date_ordinal).replace(tzinfo=timezone.utc)
 
-        # Solunar rating (0-1)
-        # Based on moon illumination and number of active periods
-        base_rating = 0.3
-        # Full/new moon boost
-        if moon_illumination > 90 or moon_illumination < 10:
-            base_rating += 0.3
-        elif moon_illumination > 40 and moon_illumination < 60:
-            base_rating += 0.15
-        # Period count bonus
-        total_periods = len(major_periods) + len(minor_periods)
-        base_rating += min(0.3, total_periods * 0.1)
-        solunar_rating = round(min(1.0, base_rating), 2)
-
-        return {
-            "majorPeriods": major_periods,
-            "minorPeriods": minor_periods,
-            "moonPhase": moon_phase,
-            "moonIllumination": moon_illumination,
-            "solunarRating": solunar_rating,
-        }
+    observer, moon, _sun = _ephem_objects()
+    observer.lat = str(lat)
+    observer.lon = str(lng)
+    observer.elevation = 0
+    observer.date = ephem.Date(date)
 
-    except Exception as e:
-        logger.error("Solunar hesaplama hatası: %s", e)
-        return _default_solunar()
+    moon.compute(observer)
+
+    # Moon illumination (0-100)
+    moon_illumination = round(moon.phase, 1)
+
+    # Determine waxing/waning: elongasyon işareti compute() ile zaten gelir —
+    # pozitifse ay güneşin doğusunda, yani büyüyor. Yarını yeniden hesaplamak
+    # gereksiz; işaret yalnızca yeni/dolunay uçlarında (faz adı zaten sabit)
+    # eski karşılaştırmadan ayrışabilir.
+    is_waxing = float(moon.elong) > 0
+
+    moon_phase = _compute_moon_phase_name(moon_illumination, is_waxing)
+
+    # Moon rise/set/transit times for major/minor periods.
+    # Periyotlar içeride dakika-int çiftleri olarak tutulur; "HH:MM"
+    # string'leri yalnızca dönüş dict'i kurulurken bir kez üretilir.
+    # UTC→yerel dönüşüm zoneinfo'dan günde bir kez dakika cinsinden alınır
+    # (sabit +3 varsayımı yerine; Türkiye DST'ye dönerse de doğru kalır).
+    tz_offset_min = int(ISTANBUL_TZ.utcoffset(date).total_seconds()) // 60
+    major_periods: list[tuple[int, int]] = []
+    minor_periods: list[tuple[int, int]] = []
+
+    # Set observer to midnight local (Istanbul UTC+3)
+    local_midnight = date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if local_midnight.tzinfo is None:
+        local_midnight = local_midnight.replace(tzinfo=timezone.utc)
+    observer.date = ephem.Date(local_midnight)
+
+    try:
+        # Moon transit (culmination) — major period
+        transit = observer.next_transit(moon)
+        transit_dt = ephem.Date(transit).datetime()
+        transit_min = (transit_dt.hour * 60 + transit_dt.minute + tz_offset_min) % 1440
+        major_periods.append(((transit_min - 60) % 1440, (transit_min + 60) % 1440))
+    except Exception:
+        pass
+
+    try:
+        # Moon anti-transit (opposite) — major period
+        anti_transit = observer.next_antitransit(moon)
+        anti_dt = ephem.Date(anti_transit).datetime()
+        anti_min = (anti_dt.hour * 60 + anti_dt.minute + tz_offset_min) % 1440
+        major_periods.append(((anti_min - 60) % 1440, (anti_min + 60) % 1440))
+    except Exception:
+        pass
+
+    try:
+        # Moon rise — minor period
+        rise = observer.next_rising(moon)
+        rise_dt = ephem.Date(rise).datetime()
+        rise_min = (rise_dt.hour * 60 + rise_dt.minute + tz_offset_min) % 1440
+        minor_periods.append(((rise_min - 30) % 1440, (rise_min + 30) % 1440))
+    except ephem.NeverUpError:
+        pass
+    except Exception:
+        pass
+
+    try:
+        # Moon set — minor period
+        setting = observer.next_setting(moon)
+        set_dt = ephem.Date(setting).datetime()
+        set_min = (set_dt.hour * 60 + set_dt.minute + tz_offset_min) % 1440
+        minor_periods.append(((set_min - 30) % 1440, (set_min + 30) % 1440))
+    except ephem.NeverUpError:
+        pass
+    except Exception:
+        pass
+
+    # Solunar rating (0-1)
+    # Based on moon illumination and number of active periods
+    base_rating = 0.3
+    # Full/new moon boost
+    if moon_illumination > 90 or moon_illumination < 10:
+        base_rating += 0.3
+    elif moon_illumination > 40 and moon_illumination < 60:
+        base_rating += 0.15
+    # Period count bonus
+    total_periods = len(major_periods) + len(minor_periods)
+    base_rating += min(0.3, total_periods * 0.1)
+    solunar_rating = round(min(1.0, base_rating), 2)
+
+    return {
+        "majorPeriods": _serialize_periods(major_periods),
+        "minorPeriods": _serialize_periods(minor_periods),
+        "moonPhase": moon_phase,
+        "moonIllumination": moon_illumination,
+        "solunarRating": solunar_rating,
+    }
+
+
+async def solunar_refresh_loop() -> None:
+    """Günlük solunar ön-ısıtma döngüsü (lifespan'de task olarak çalışır).
+
+    Başlangıçta ve her UTC gece yarısından hemen sonra günün solunar
+    verisini hesaplayarak lru_cache'i sıcak tutar; böylece günün ilk
+    isteği ephem transit aramalarını beklemez.
+    """
+    while True:
+        try:
+            compute_solunar()
+        except Exception as e:
+            logger.warning("Solunar ön-ısıtma hatası: %s", e)
+
+        now = datetime.now(tz=timezone.utc)
+        next_midnight = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        await asyncio.sleep((next_midnight - now).total_seconds() + 1)
 
 
 def compute_daylight(
@@ -227,7 +271,7 @@ def compute_daylight(
          tz: "Europe/Istanbul"}
     """
     try:
-        import ephem
+        import ephem  # noqa: F401 — yalnızca varlık kontrolü
     except ImportError:
         logger.warning("ephem not available — using daylight fallback")
         return _default_daylight(date)
@@ -236,44 +280,60 @@ def compute_daylight(
         date = datetime.now(tz=timezone.utc)
 
     try:
-        observer = ephem.Observer()
-        observer.lat = str(lat)
-        observer.lon = str(lng)
-        observer.elevation = 0
-        # Use noon UTC for the given date to find today's rise/set
-        obs_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        if obs_date.tzinfo is None:
-            obs_date = obs_date.replace(tzinfo=timezone.utc)
-        observer.date = ephem.Date(obs_date)
-
-        sun = ephem.Sun()
-
-        rise = observer.next_rising(sun)
-        rise_dt = ephem.Date(rise).datetime().replace(tzinfo=timezone.utc)
-        rise_local = rise_dt.astimezone(ISTANBUL_TZ)
-
-        sett = observer.next_setting(sun)
-        set_dt = ephem.Date(sett).datetime().replace(tzinfo=timezone.utc)
-        set_local = set_dt.astimezone(ISTANBUL_TZ)
-
-        # Determine isDaylight for the given time
-        now_local = date.astimezone(ISTANBUL_TZ) if date.tzinfo else date.replace(tzinfo=timezone.utc).astimezone(ISTANBUL_TZ)
-        now_minutes = now_local.hour * 60 + now_local.minute
-        rise_minutes = rise_local.hour * 60 + rise_local.minute
-        set_minutes = set_local.hour * 60 + set_local.minute
-
-        is_daylight = rise_minutes <= now_minutes <= set_minutes
-
-        return {
-            "isDaylight": is_daylight,
-            "sunriseLocal": _time_str(rise_local),
-            "sunsetLocal": _time_str(set_local),
-            "tz": "Europe/Istanbul",
-        }
+        rise_minutes, set_minutes, sunrise_str, sunset_str = _compute_daylight_cached(
+            date.toordinal(), round(lat, 2), round(lng, 2)
+        )
     except Exception as e:
         logger.error("Daylight computation error: %s", e)
         return _default_daylight(date)
 
+    # isDaylight anın saatine bağlıdır — cache'lenmez, her çağrıda hesaplanır
+    now_local = date.astimezone(ISTANBUL_TZ) if date.tzinfo else date.replace(tzinfo=timezone.utc).astimezone(ISTANBUL_TZ)
+    now_minutes = now_local.hour * 60 + now_local.minute
+
+    return {
+        "isDaylight": rise_minutes <= now_minutes <= set_minutes,
+        "sunriseLocal": sunrise_str,
+        "sunsetLocal": sunset_str,
+        "tz": "Europe/Istanbul",
+    }
+
+
+@lru_cache(maxsize=256)
+def _compute_daylight_cached(
+    date_ordinal: int, lat: float, lng: float
+) -> tuple[int, int, str, str]:
+    """Gün + koordinat başına güneş doğuş/batışını hesaplar (LRU'lu).
+
+    Returns:
+        (rise_minutes, set_minutes, sunriseLocal, sunsetLocal) — dakikalar
+        yerel gün içi dakika, string'ler "HH:MM".
+    """
+    import ephem
+
+    observer, _moon, sun = _ephem_objects()
+    observer.lat = str(lat)
+    observer.lon = str(lng)
+    observer.elevation = 0
+    # Use midnight UTC for the given date to find today's rise/set
+    obs_date = datetime.fromordinal(date_ordinal).replace(tzinfo=timezone.utc)
+    observer.date = ephem.Date(obs_date)
+
+    rise = observer.next_rising(sun)
+    rise_dt = ephem.Date(rise).datetime().replace(tzinfo=timezone.utc)
+    rise_local = rise_dt.astimezone(ISTANBUL_TZ)
+
+    sett = observer.next_setting(sun)
+    set_dt = ephem.Date(sett).datetime().replace(tzinfo=timezone.utc)
+    set_local = set_dt.astimezone(ISTANBUL_TZ)
+
+    return (
+        rise_local.hour * 60 + rise_local.minute,
+        set_local.hour * 60 + set_local.minute,
+        _time_str(rise_local),
+        _time_str(set_local),
+    )
+
 
 def _default_daylight(date: Optional[datetime] = None) -> dict[str, Any]:
     """Fallback daylight data when ephem is unavailable.
@@ -297,22 +357,28 @@ def _default_daylight(date: Optional[datetime] = None) -> dict[str, Any]:
     }
 
 
+# Fallback verisi sabittir; her çağrıda yeniden kurmak yerine modül
+# seviyesinde bir kez oluşturulur. Çağıranlar solunar dict'lerini salt-okur
+# kullanır (compute_solunar'ın cache'li dönüşüyle aynı sözleşme).
+_DEFAULT_SOLUNAR: dict[str, Any] = {
+    "majorPeriods": [
+        {"start": "06:00", "end": "08:00"},
+        {"start": "18:00", "end": "20:00"},
+    ],
+    "minorPeriods": [
+        {"start": "12:00", "end": "13:00"},
+        {"start": "00:00", "end": "01:00"},
+    ],
+    "moonPhase": "waxing_crescent",
+    "moonIllumination": 35.0,
+    "solunarRating": 0.5,
+}
+
+
 def _default_solunar() -> dict[str, Any]:
     """ephem olmadığında veya hata durumunda varsayılan solunar verisi.
 
     Returns:
-        Default solunar dict.
+        Default solunar dict (paylaşılan sabit; mutasyon yapılmamalı).
     """
-    return {
-        "majorPeriods": [
-            {"start": "06:00", "end": "08:00"},
-            {"start": "18:00", "end": "20:00"},
-        ],
-        "minorPeriods": [
-            {"start": "12:00", "end": "13:00"},
-            {"start": "00:00", "end": "01:00"},
-        ],
-        "moonPhase": "waxing_crescent",
-        "moonIllumination": 35.0,
-        "solunarRating": 0.5,
-    }
+    return _DEFAULT_SOLUNAR
@@ -9,6 +9,9 @@ from __future__ import annotations
 # Canonical 8-cardinal set (clockwise from N)
 CARDINAL_8 = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
 
+# Cardinal → sector index (0..7, clockwise from N); integer-keyed hot paths
+CARDINAL_INDEX: dict[str, int] = {c: i for i, c in enumerate(CARDINAL_8)}
+
 # 16-point and alternate forms → canonical 8-cardinal
 _NORMALIZE_MAP: dict[str, str] = {
     "NNE": "NE",
@@ -22,6 +25,21 @@ _NORMALIZE_MAP: dict[str, str] = {
 }
 
 
+def degrees_to_sector_8(deg: float) -> int:
+    """Convert degrees (0-359) to an 8-sector index (0=N .. 7=NW).
+
+    Integer form of degrees_to_cardinal_8 for code that compares or
+    tables directions numerically instead of by string.
+
+    Args:
+        deg: Wind direction in degrees (meteorological convention).
+
+    Returns:
+        Sector index 0-7, clockwise from N.
+    """
+    return round(deg / 45) % 8
+
+
 def degrees_to_cardinal_8(deg: float) -> str:
     """Convert degrees (0-359) to 8-point cardinal direction.
 
@@ -31,7 +49,7 @@ def degrees_to_cardinal_8(deg: float) -> str:
     Returns:
         One of N, NE, E, SE, S, SW, W, NW.
     """
-    return CARDINAL_8[round(deg / 45) % 8]
+    return CARDINAL_8[degrees_to_sector_8(deg)]
 
 
 def normalize_cardinal_8(card: str) -> str:
@@ -0,0 +1,114 @@
+"""Tests for rule condition semantics: compiled vs interpreted parity.
+
+The compiled matcher path (compile_rules/_compiled) must behave exactly
+like the reference evaluate_condition for edge-case condition values.
+"""
+
+import pytest
+
+from app.services.rules import TIER1_SPECIES, evaluate_condition, evaluate_rules
+
+
+BASE_CONTEXT = {
+    "windSpeedKmh": 12.0,
+    "windDirectionCardinal": "NE",
+    "pressureHpa": 1015.0,
+    "shore": "european",
+    "regionId": "avrupa",
+    "spot": "tarabya",
+    "features": ["kayalik"],
+    "hour": 17,
+    "minute": 0,
+    "month": 10,
+    "isDaylight": True,
+    "shelteredFrom": ["NE", "N"],
+}
+
+
+def _rule(condition):
+    return {
+        "id": "test_condition",
+        "condition": condition,
+        "effects": [{"applyToSpecies": ["*"], "scoreBonus": 5}],
+        "messageTR": "Test rule",
+        "priority": 5,
+        "category": "techniqueTime",
+    }
+
+
+class TestListConditionAgainstListContext:
+    """A list-valued condition on a list-valued context field must not crash.
+
+    shelteredFrom in the context is itself a list; `actual in expected`
+    returns False on the interpreted path, and the compiled frozenset
+    membership must do the same instead of raising TypeError.
+    """
+
+    def test_evaluate_condition_returns_false(self):
+        assert evaluate_condition({"shelteredFrom": ["N", "NE"]}, dict(BASE_CONTEXT)) is False
+
+    def test_compiled_path_returns_false_without_error(self):
+        rules = [_rule({"shelteredFrom": ["N", "NE"]})]
+        result = evaluate_rules(rules, dict(BASE_CONTEXT), species_list=TIER1_SPECIES)
+        assert result.fired_rules_count == 0
+
+    def test_list_condition_on_scalar_context_still_matches(self):
+        rules = [_rule({"windDirectionCardinal": ["NE", "N"]})]
+        result = evaluate_rules(rules, dict(BASE_CONTEXT), species_list=TIER1_SPECIES)
+        assert result.fired_rules_count == 1
+
+
+class TestTypedOperatorConditions:
+    """Typed operator objects ({"gte": 12, "lt": 35}) on both eval paths."""
+
+    def _fires(self, condition, context):
+        rules = [_rule(condition)]
+        result = evaluate_rules(rules, context, species_list=TIER1_SPECIES)
+        return result.fired_rules_count == 1
+
+    def test_multi_key_and_matches(self):
+        condition = {"windSpeedKmh": {"gte": 10, "lt": 35}}
+        context = dict(BASE_CONTEXT)  # windSpeedKmh 12.0
+        assert evaluate_condition(condition, context) is True
+        assert self._fires(condition, context)
+
+    def test_multi_key_and_rejects_out_of_range(self):
+        condition = {"windSpeedKmh": {"gte": 10, "lt": 35}}
+        context = dict(BASE_CONTEXT, windSpeedKmh=40.0)
+        assert evaluate_condition(condition, context) is False
+        assert not self._fires(condition, context)
+
+    def test_boundaries_inclusive_and_exclusive(self):
+        condition = {"windSpeedKmh": {"gte": 12, "lt": 35}}
+        at_lower = dict(BASE_CONTEXT, windSpeedKmh=12.0)
+        at_upper = dict(BASE_CONTEXT, windSpeedKmh=35.0)
+        assert evaluate_condition(condition, at_lower) is True
+        assert self._fires(condition, at_lower)
+        assert evaluate_condition(condition, at_upper) is False
+        assert not self._fires(condition, at_upper)
+
+    def test_missing_context_value_is_no_match(self):
+        condition = {"currentSpeed": {"gte": 0.5}}
+        context = dict(BASE_CONTEXT)  # currentSpeed absent
+        assert evaluate_condition(condition, context) is False
+        assert not self._fires(condition, context)
+
+    def test_unparseable_context_value_is_no_match(self):
+        condition = {"windSpeedKmh": {"gte": 10}}
+        context = dict(BASE_CONTEXT, windSpeedKmh="harika")
+        assert evaluate_condition(condition, context) is False
+        assert not self._fires(condition, context)
+
+    def test_malformed_threshold_is_no_match_and_warns(self, caplog):
+        condition = {"windSpeedKmh": {"gte": "abc"}}
+        context = dict(BASE_CONTEXT)
+        assert evaluate_condition(condition, context) is False
+        with caplog.at_level("WARNING", logger="app.services.rules"):
+            assert not self._fires(condition, context)
+        assert any("derlenemedi" in r.message for r in caplog.records)
+
+    def test_unknown_operator_key_warns(self, caplog):
+        condition = {"windSpeedKmh": {"gte": 10, "ltx": 35}}
+        with caplog.at_level("WARNING", logger="app.services.rules"):
+            assert not self._fires(condition, dict(BASE_CONTEXT))
+        assert any("bilinmeyen operatör" in r.message for r in caplog.records)